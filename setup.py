@@ -5,6 +5,9 @@ setup(
     version="0.0.8",
     packages=find_packages(),
     install_requires=[],
+    extras_require={
+        "httpx": ["httpx[http2]"],
+    },
     url="https://github.com/sythonlab/SythonLab-Amadeus-Enterprise-Rest",
     author="José Angel Alvarez Abraira",
     author_email="sythonlab@gmail.com",
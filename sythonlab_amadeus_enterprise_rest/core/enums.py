@@ -16,6 +16,7 @@ class RequestMethod(Enum):
     GET = "GET"
     DELETE = "DELETE"
     PATCH = "PATCH"
+    HEAD = "HEAD"
 
 
 class Currency(Enum):
@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: archive.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import gzip
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, List, Optional, Tuple
+
+from sythonlab_amadeus_enterprise_rest.flights.capture import redact
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import CompactFlightRequestMetadata, FlightArchiveEntry, \
+    FlightRawResponse
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightArchiveCodec, FlightResultKind
+from sythonlab_amadeus_enterprise_rest.flights.store import order_locator
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS flight_archive_records (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    segment TEXT NOT NULL,
+    block_offset INTEGER NOT NULL,
+    block_size INTEGER NOT NULL,
+    position INTEGER NOT NULL,
+    ama_client TEXT,
+    booking_id TEXT,
+    locator TEXT,
+    kind TEXT,
+    status INTEGER,
+    start_time REAL
+);
+CREATE INDEX IF NOT EXISTS flight_archive_records_ama_client ON flight_archive_records (ama_client);
+CREATE INDEX IF NOT EXISTS flight_archive_records_booking ON flight_archive_records (booking_id);
+CREATE INDEX IF NOT EXISTS flight_archive_records_locator ON flight_archive_records (locator);
+CREATE INDEX IF NOT EXISTS flight_archive_records_kind ON flight_archive_records (kind, start_time);
+CREATE INDEX IF NOT EXISTS flight_archive_records_time ON flight_archive_records (start_time);
+"""
+
+SEGMENT_EXTENSIONS = {
+    FlightArchiveCodec.GZIP: ".jsonl.gz",
+    FlightArchiveCodec.ZSTD: ".jsonl.zst",
+}
+
+# Kinds whose response is a flight order, read to index the booking ID and locator of reserves.
+ORDER_KINDS = frozenset({
+    FlightResultKind.FLIGHT_RESERVE, FlightResultKind.FLIGHT_RETRIEVE_BY_ID, FlightResultKind.FLIGHT_RETRIEVE_BY_PNR,
+    FlightResultKind.FLIGHT_ISSUE, FlightResultKind.FLIGHT_COMMISSION_BOOKING,
+})
+
+BOOKING_ID_PATTERN = re.compile(r"/flight-orders/(?!by-reference)([^/?]+)")
+LOCATOR_PATTERN = re.compile(r"[?&]reference=([^&]+)")
+
+
+def archive_references(metadata: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Return the booking ID and record locator a request is about, from its URL or its flight order response."""
+
+    booking_id = BOOKING_ID_PATTERN.search(metadata.url or "")
+    locator = LOCATOR_PATTERN.search(metadata.url or "")
+    booking_id = booking_id.group(1) if booking_id else None
+    locator = locator.group(1) if locator else None
+
+    if metadata.kind in ORDER_KINDS and metadata.status in (200, 201):
+        order = (metadata.response or {}).get("data") if isinstance(metadata.response, dict) else None
+        order = order[0] if isinstance(order, list) and order else order
+
+        if isinstance(order, dict):
+            booking_id = booking_id or order.get("id")
+            locator = locator or order_locator(order)
+
+    return booking_id, locator
+
+
+def decode_raw_body(body: bytes) -> Any:
+    """Decode a raw request or response body as JSON, or as text if it is not a JSON document."""
+
+    if not body.strip():
+        return None
+
+    try:
+        return json.loads(body)
+    except ValueError:
+        return body.decode("utf-8", errors="replace")
+
+
+def archive_record(metadata: Any) -> bytes:
+    """Serialize request metadata as one redacted JSON line, without the Authorization header.
+
+    Headers, request and response go through capture.redact, so tokens, client secrets, card data and passenger
+    PII never reach the archive. Undecoded passthrough responses are archived as null.
+    """
+
+    if isinstance(metadata, CompactFlightRequestMetadata):
+        request, response = decode_raw_body(metadata.raw_request), decode_raw_body(metadata.raw_response)
+    else:
+        request = metadata.request
+        response = None if isinstance(metadata.response, FlightRawResponse) else metadata.response
+
+    return json.dumps(redact({
+        "status": metadata.status,
+        "ama_client": metadata.ama_client,
+        "method": metadata.method.value if metadata.method else None,
+        "url": metadata.url,
+        "kind": metadata.kind.value if metadata.kind else None,
+        "headers": {key: value for key, value in (metadata.headers or {}).items() if key != "Authorization"},
+        "start_time": metadata.start_time.isoformat() if metadata.start_time else None,
+        "end_time": metadata.end_time.isoformat() if metadata.end_time else None,
+        "duration": metadata.duration,
+        "request": request,
+        "response": response,
+    }), default=str).encode("utf-8") + b"\n"
+
+
+class FlightArchive:
+    """Append-only archive of on_complete metadata in compressed, rotated segment files with a sqlite index.
+
+    Records are buffered as JSON lines and written in blocks of about block_size bytes, each compressed on its own
+    (gzip members or zstd frames, so a whole segment also decompresses with zcat or zstdcat). A block is also
+    written once its oldest record is block_age seconds old; both limits are checked on append, so call flush()
+    when traffic stops. Segments rotate once they reach segment_size compressed bytes or segment_age seconds.
+    The sidecar index maps the ama-client-ref, booking ID, locator, kind and start time of every record to its
+    block, so reading one exchange seeks to and decompresses a single block. Records are redacted before they are
+    buffered. Pass the archive as on_complete.
+    """
+
+    def __init__(
+            self,
+            directory: str,
+            *,
+            codec: FlightArchiveCodec = FlightArchiveCodec.GZIP,
+            level: Optional[int] = None,
+            block_size: int = 256 * 1024,
+            block_age: float = 5.0,
+            segment_size: int = 64 * 1024 * 1024,
+            segment_age: float = 3600.0,
+            index_path: Optional[str] = None
+    ):
+        """Open (or create) the archive in directory; zstd requires the optional zstandard package."""
+
+        if codec == FlightArchiveCodec.ZSTD and zstandard is None:
+            raise ImportError("FlightArchiveCodec.ZSTD requires zstandard: pip install zstandard")
+
+        os.makedirs(directory, exist_ok=True)
+
+        self.directory = directory
+        self.codec = codec
+        self.level = level
+        self.block_size = block_size
+        self.block_age = block_age
+        self.segment_size = segment_size
+        self.segment_age = segment_age
+        self.archived = 0
+        self.blocks = 0
+        self._lock = threading.Lock()
+        self._read_lock = threading.Lock()
+        self._buffer: List[bytes] = []
+        self._buffered = 0
+        self._buffered_at = 0.0
+        self._pending: List[Tuple[Any, ...]] = []
+        self._segment: Optional[str] = None
+        self._segment_file = None
+        self._segment_opened_at = 0.0
+        self._cached_block: Tuple[Any, List[bytes]] = (None, [])
+        self._connection = sqlite3.connect(index_path or os.path.join(directory, "index.sqlite"),
+                                           check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(SCHEMA)
+
+    def __call__(self, *, metadata: Any):
+        """Archive the metadata of a request, as an on_complete callback."""
+
+        self.append(metadata)
+
+    def append(self, metadata: Any):
+        """Buffer the metadata of a request, writing a block when it is due."""
+
+        line = archive_record(metadata)
+        booking_id, locator = archive_references(metadata)
+        start_time = metadata.start_time.timestamp() if metadata.start_time else time.time()
+
+        with self._lock:
+            if not self._buffer:
+                self._buffered_at = time.monotonic()
+
+            self._pending.append((len(self._buffer), metadata.ama_client, booking_id, locator,
+                                  metadata.kind.value if metadata.kind else None, metadata.status, start_time))
+            self._buffer.append(line)
+            self._buffered += len(line)
+
+            if self._buffered >= self.block_size or time.monotonic() - self._buffered_at >= self.block_age:
+                self._write_block()
+
+    def flush(self):
+        """Write the buffered records as a block, making them readable."""
+
+        with self._lock:
+            self._write_block()
+
+    def close(self):
+        """Flush the buffered records and close the segment file and the index."""
+
+        with self._lock:
+            self._write_block()
+
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+
+            self._connection.close()
+
+    def find(
+            self,
+            *,
+            ama_client: Optional[str] = None,
+            booking_id: Optional[str] = None,
+            locator: Optional[str] = None,
+            kind: Optional[FlightResultKind] = None,
+            since: Optional[float] = None,
+            until: Optional[float] = None,
+            limit: int = 100
+    ) -> List[FlightArchiveEntry]:
+        """Return the index entries of the written records matching every given filter, newest first.
+
+        since and until are epoch seconds bounding the request start time.
+        """
+
+        query = ("SELECT segment, block_offset, block_size, position, ama_client, booking_id, locator, kind, status, "
+                 "start_time FROM flight_archive_records WHERE 1 = 1")
+        params = []
+
+        for column, value in (("ama_client", ama_client), ("booking_id", booking_id), ("locator", locator),
+                              ("kind", kind.value if kind else None)):
+            if value is not None:
+                query += f" AND {column} = ?"
+                params.append(value)
+
+        if since is not None:
+            query += " AND start_time >= ?"
+            params.append(since)
+
+        if until is not None:
+            query += " AND start_time < ?"
+            params.append(until)
+
+        query += " ORDER BY start_time DESC, id DESC LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+
+        return [
+            FlightArchiveEntry(segment=row[0], offset=row[1], size=row[2], position=row[3], ama_client=row[4],
+                               booking_id=row[5], locator=row[6], kind=FlightResultKind(row[7]) if row[7] else None,
+                               status=row[8], start_time=row[9])
+            for row in rows
+        ]
+
+    def read(self, entry: FlightArchiveEntry) -> Any:
+        """Read one archived record by seeking to and decompressing its block only."""
+
+        key = (entry.segment, entry.offset)
+
+        with self._read_lock:
+            cached_key, lines = self._cached_block
+
+            if cached_key != key:
+                with open(os.path.join(self.directory, entry.segment), "rb") as segment_file:
+                    segment_file.seek(entry.offset)
+                    block = segment_file.read(entry.size)
+
+                lines = self.decompress(block, entry.segment).split(b"\n")
+                self._cached_block = (key, lines)
+
+        return json.loads(lines[entry.position])
+
+    def lookup(self, **filters) -> List[Any]:
+        """Return the archived records matching the find() filters, newest first."""
+
+        return [self.read(entry) for entry in self.find(**filters)]
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress one block with the codec of the archive."""
+
+        if self.codec == FlightArchiveCodec.ZSTD:
+            return zstandard.ZstdCompressor(level=self.level or 3).compress(data)
+
+        return gzip.compress(data, compresslevel=self.level or 6)
+
+    @staticmethod
+    def decompress(block: bytes, segment: str) -> bytes:
+        """Decompress one block of a segment, with the codec given by its extension."""
+
+        if segment.endswith(SEGMENT_EXTENSIONS[FlightArchiveCodec.ZSTD]):
+            if zstandard is None:
+                raise ImportError("Reading zstd segments requires zstandard: pip install zstandard")
+
+            return zstandard.ZstdDecompressor().decompress(block)
+
+        return gzip.decompress(block)
+
+    def _write_block(self):
+        """Compress the buffered records into the current segment and index them. The lock must be held."""
+
+        if not self._buffer:
+            return
+
+        if self._segment_file is None or self._segment_file.tell() >= self.segment_size or \
+                time.monotonic() - self._segment_opened_at >= self.segment_age:
+            self._rotate()
+
+        block = self.compress(b"".join(self._buffer))
+        offset = self._segment_file.tell()
+        self._segment_file.write(block)
+        self._segment_file.flush()
+
+        connection = self._connection
+        connection.execute("BEGIN")
+
+        try:
+            connection.executemany(
+                "INSERT INTO flight_archive_records (segment, block_offset, block_size, position, ama_client, "
+                "booking_id, locator, kind, status, start_time) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                [(self._segment, offset, len(block)) + pending for pending in self._pending]
+            )
+            connection.execute("COMMIT")
+        except Exception:
+            connection.execute("ROLLBACK")
+            raise
+
+        self.archived += len(self._buffer)
+        self.blocks += 1
+        self._buffer, self._pending, self._buffered = [], [], 0
+
+    def _rotate(self):
+        """Close the current segment and open a new one. The lock must be held."""
+
+        if self._segment_file is not None:
+            self._segment_file.close()
+
+        self._segment = f"flight-archive-{time.time_ns()}{SEGMENT_EXTENSIONS[self.codec]}"
+        self._segment_file = open(os.path.join(self.directory, self._segment), "ab")
+        self._segment_opened_at = time.monotonic()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: cache.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional, Tuple, Dict, Set
+
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind
+
+
+class FlightResultCache:
+    """Short-TTL, size-bounded LRU cache for pricing and upsell responses keyed by offer fingerprint."""
+
+    def __init__(self, *, ttl: float = 60.0, max_entries: int = 256):
+        """Initialize the cache with the entry time-to-live in seconds and the maximum number of entries."""
+
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[tuple, Tuple[float, int, Any]]" = OrderedDict()
+        self._by_offer: Dict[str, Set[tuple]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def build_key(kind: FlightResultKind, offer_fingerprint: str, *extra: Any) -> tuple:
+        """Build a cache key for a kind of request on an offer, plus request options such as payment method."""
+
+        return (kind, offer_fingerprint, *extra)
+
+    def get(self, key: tuple) -> Optional[Tuple[int, Any]]:
+        """Return a copy of the cached (status, data) for the key, or None if missing or expired."""
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+            status, data = entry[1], entry[2]
+
+        return status, copy.deepcopy(data)
+
+    def set(self, key: tuple, status: int, data: Any):
+        """Store a response under the key, evicting the least recently used entries above the size bound."""
+
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, status, copy.deepcopy(data))
+            self._entries.move_to_end(key)
+            self._by_offer.setdefault(key[1], set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                self._discard(next(iter(self._entries)))
+
+    def invalidate(self, offer_fingerprint: str):
+        """Drop every cached response for the offer, whatever the kind or payment options."""
+
+        with self._lock:
+            for key in list(self._by_offer.get(offer_fingerprint, ())):
+                self._discard(key)
+
+    def clear(self):
+        """Drop every cached response."""
+
+        with self._lock:
+            self._entries.clear()
+            self._by_offer.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _discard(self, key: tuple):
+        """Remove a key from the entries and the offer index. The lock must be held."""
+
+        self._entries.pop(key, None)
+        keys = self._by_offer.get(key[1])
+
+        if keys is not None:
+            keys.discard(key)
+
+            if not keys:
+                del self._by_offer[key[1]]
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: capture.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import json
+import logging
+import queue
+import random
+import re
+import threading
+from typing import Any, Callable, Dict, Optional
+
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind
+
+logger = logging.getLogger(__name__)
+
+REDACTED = "***"
+
+# Keys redacted wherever they appear (compared lower-cased).
+SECRET_KEYS = frozenset({
+    "authorization", "access_token", "client_secret", "client_id", "securitycode", "firstname",
+    "lastname", "middlename", "emailaddress", "dateofbirth", "expirydate",
+})
+
+# Keys redacted only below one of these parents, e.g. the card, phone or passport "number" but not the flight one.
+SECRET_CHILD_KEYS = {
+    "creditcard": frozenset({"number", "holder"}),
+    "phones": frozenset({"number"}),
+    "documents": frozenset({"number", "issuancedate"}),
+}
+
+# Kinds whose request payloads carry client secrets or card data.
+SECRET_KINDS = frozenset({FlightResultKind.LOGIN, FlightResultKind.FLIGHT_RESERVE})
+
+PAN_PATTERN = re.compile(r"\b\d{13,19}\b")
+
+
+def mask_pan(text: str) -> str:
+    """Mask every card-number-like digit run in a string, keeping its last four digits."""
+
+    return PAN_PATTERN.sub(lambda match: "*" * (len(match.group()) - 4) + match.group()[-4:], text)
+
+
+def redact(value: Any, parent: Optional[str] = None) -> Any:
+    """Return a copy of a payload, headers or response with tokens, card data and passenger PII redacted."""
+
+    if isinstance(value, dict):
+        child_keys = SECRET_CHILD_KEYS.get(parent or "", frozenset())
+        redacted = {}
+
+        for key, item in value.items():
+            lowered = str(key).lower()
+
+            if lowered in SECRET_KEYS or lowered in child_keys:
+                redacted[key] = REDACTED
+            else:
+                redacted[key] = redact(item, lowered if isinstance(item, (dict, list)) else None)
+
+        return redacted
+
+    if isinstance(value, list):
+        return [redact(item, parent) for item in value]
+
+    if isinstance(value, str):
+        return mask_pan(value)
+
+    return value
+
+
+class RequestCapture:
+    """Sampled, redacted capture of SDK request/response exchanges.
+
+    Nothing is built for unsampled requests. Sampled exchanges are queued as lazy builders; redaction,
+    serialization and truncation to max_bytes happen on a background thread that hands each record to the sink.
+    When the queue is full, records are dropped and counted rather than slowing the request path.
+    """
+
+    def __init__(
+            self,
+            *,
+            sample_rates: Optional[Dict[FlightResultKind, float]] = None,
+            default_rate: float = 0.0,
+            max_bytes: int = 64 * 1024,
+            sink: Optional[Callable[[str], None]] = None,
+            queue_size: int = 1000
+    ):
+        """Initialize the capture with per-kind sample rates (0..1), a size cap and a sink(record) callable."""
+
+        self.sample_rates = sample_rates or {}
+        self.default_rate = default_rate
+        self.max_bytes = max_bytes
+        self.sink = sink or (lambda record: logger.info("Captured exchange: %s", record))
+        self.captured = 0
+        self.dropped = 0
+        self._lock = threading.Lock()
+        self._queue: "queue.Queue[Optional[Callable[[], Dict[str, Any]]]]" = queue.Queue(maxsize=queue_size)
+        self._worker = threading.Thread(target=self._drain, name="flight-capture", daemon=True)
+        self._worker.start()
+
+    def should_sample(self, kind: Optional[FlightResultKind]) -> bool:
+        """Decide whether an exchange of the kind is captured."""
+
+        rate = self.sample_rates.get(kind, self.default_rate)
+
+        return rate > 0 and (rate >= 1 or random.random() < rate)
+
+    def submit(self, build: Callable[[], Dict[str, Any]]):
+        """Queue a sampled exchange; build is only called on the capture thread."""
+
+        try:
+            self._queue.put_nowait(build)
+        except queue.Full:
+            with self._lock:
+                self.dropped += 1
+
+    def close(self, timeout: Optional[float] = None):
+        """Flush the queued exchanges and stop the capture thread."""
+
+        self._queue.put(None)
+        self._worker.join(timeout)
+
+    def serialize(self, record: Dict[str, Any]) -> str:
+        """Redact a record and encode it as JSON, truncated to max_bytes."""
+
+        encoded = json.dumps(redact(record), default=str)
+
+        if len(encoded) > self.max_bytes:
+            encoded = f"{encoded[:self.max_bytes]}...[truncated {len(encoded) - self.max_bytes} chars]"
+
+        return encoded
+
+    def _drain(self):
+        """Serialize queued exchanges and hand them to the sink until closed."""
+
+        while True:
+            build = self._queue.get()
+
+            if build is None:
+                return
+
+            try:
+                self.sink(self.serialize(build()))
+
+                with self._lock:
+                    self.captured += 1
+            except Exception:
+                logger.exception("Unable to capture exchange")
@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: concurrency.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Iterable, Iterator, Tuple, Any, Optional
+
+RETRYABLE_STATUSES = frozenset({401, 408, 429, 500, 502, 503, 504})
+
+# Statuses returned before the upstream acted on the request, safe to retry even for non-idempotent calls.
+UNPROCESSED_STATUSES = frozenset({401, 429})
+
+
+def bounded_map(fn: Callable[[Any], Any], items: Iterable[Any], *, max_workers: int = 8) -> Iterator[Tuple[Any, Any]]:
+    """Run fn over items in a thread pool and yield (item, result) as they complete.
+
+    At most max_workers calls run at once and at most twice that many items are taken from the
+    iterable ahead of the consumer, so large or lazy inputs never get materialized. Exceptions raised
+    by fn are yielded in place of the result.
+    """
+
+    iterator = iter(items)
+    pending = {}
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        def submit_next() -> bool:
+            for item in iterator:
+                pending[executor.submit(fn, item)] = item
+                return True
+            return False
+
+        for _ in range(max_workers * 2):
+            if not submit_next():
+                break
+
+        while pending:
+            done, _ = wait(pending, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                item = pending.pop(future)
+                error = future.exception()
+                yield item, error if error is not None else future.result()
+                submit_next()
+
+
+def call_with_retries(
+        fn: Callable[[], Tuple[int, Any]],
+        *,
+        retries: int = 2,
+        backoff: float = 0.5,
+        retry_on: Tuple[type, ...] = (),
+        retry_statuses: frozenset = RETRYABLE_STATUSES,
+        on_retry: Optional[Callable[[int, Any], None]] = None
+) -> Tuple[int, Any]:
+    """Call fn until it returns a non-retryable status, retrying with exponential backoff.
+
+    fn returns a (status, data) tuple and is retried on retry_statuses. Exceptions listed in retry_on are
+    retried as well and re-raised once the retries are exhausted. on_retry, if given, receives the status
+    (or exception) that triggered each retry.
+    """
+
+    attempt = 0
+
+    while True:
+        try:
+            status, data = fn()
+        except retry_on as error:
+            if attempt >= retries:
+                raise
+            outcome = error
+        else:
+            if status not in retry_statuses or attempt >= retries:
+                return status, data
+            outcome = status
+
+        if on_retry:
+            on_retry(attempt, outcome)
+
+        time.sleep(backoff * (2 ** attempt))
+        attempt += 1
+
+
+class RateLimiter:
+    """Thread-safe token bucket allowing rate calls per second with bursts of up to burst calls."""
+
+    def __init__(self, rate: float, *, burst: Optional[int] = None):
+        """Initialize the bucket full, with rate tokens added per second."""
+
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Block until a token is available and take it."""
+
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+
+                wait_time = (1 - self._tokens) / self.rate
+
+            time.sleep(wait_time)
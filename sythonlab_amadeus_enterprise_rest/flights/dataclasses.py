@@ -6,12 +6,14 @@ Author: Sython Lab (sythonlab@gmail.com)
 Created: 2025-12-04
 """
 
-from dataclasses import dataclass
+import json
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Any
+from typing import Optional, Any, List, Callable, Iterator, Union, Dict
 
 from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Gender, DocumentType, CardBrand, RequestMethod
-from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind, FlightCabin, FlightFareType, \
+    FlightPassthrough, FlightProfilePhase
 
 
 @dataclass
@@ -32,6 +34,27 @@ class SearchAvailabilityPax:
     traveler_type: TravelerType
 
 
+@dataclass
+class SearchOptions:
+    """Dataclass for search shaping options, used to request smaller shopping responses.
+
+    Offer limits and the alternative fare toggle only apply to search_availability. excluded_carriers cannot be
+    combined with only_carriers.
+    """
+
+    max_flight_offers: int = 250
+    max_upsell_offers: int = 4
+    branded_fares: bool = True
+    allow_alternative_fare_options: bool = True
+    fare_types: List[FlightFareType] = field(default_factory=lambda: [FlightFareType.PUBLISHED])
+    sources: List[str] = field(default_factory=lambda: ["GDS"])
+    cabin: Optional[FlightCabin] = None
+    max_stops: Optional[int] = None
+    airport_change_allowed: Optional[bool] = None
+    technical_stops_allowed: Optional[bool] = None
+    excluded_carriers: Optional[List[str]] = None
+
+
 @dataclass
 class ReservePax:
     """Dataclass for reserve passenger."""
@@ -80,9 +103,242 @@ class FlightRequestMetadata:
     duration: Optional[float] = None
 
 
+@dataclass(slots=True)
+class CompactFlightRequestMetadata:
+    """Memory-bounded flight request metadata.
+
+    Keeps the raw request and response bodies as bytes, once, and decodes them on every access instead of
+    holding references to the parsed structures. Headers are kept without the Authorization token, and login and
+    reserve payloads are kept redacted, without client secrets or card data.
+    """
+
+    status: int
+    ama_client: str
+    method: RequestMethod
+    url: str
+    kind: FlightResultKind
+    headers: Any
+    raw_request: bytes
+    raw_response: bytes
+    start_time: Optional[datetime] = None
+    end_time: Optional[datetime] = None
+    duration: Optional[float] = None
+
+    @property
+    def request(self) -> Any:
+        """Decode the request payload; the result is not retained."""
+
+        return json.loads(self.raw_request) if self.raw_request else {}
+
+    @property
+    def response(self) -> Any:
+        """Decode the response body; the result is not retained."""
+
+        return json.loads(self.raw_response) if self.raw_response else {}
+
+    @property
+    def size(self) -> int:
+        """Number of body bytes retained by this metadata."""
+
+        return len(self.raw_request) + len(self.raw_response)
+
+    def preview(self, limit: int = 512) -> str:
+        """Return at most limit characters of the response body, without decoding it as JSON."""
+
+        text = self.raw_response[:limit].decode("utf-8", errors="replace")
+
+        return f"{text}..." if len(self.raw_response) > limit else text
+
+
 @dataclass
 class FlightReserveQueueData:
     """Dataclass for flight reserve queue data."""
 
     queue: str
     category: str
+
+
+@dataclass
+class FlightQueueDiff:
+    """Dataclass for the changes found by a queue watcher poll; added and removed hold sorted entry keys."""
+
+    queue: str
+    category: str
+    total: int
+    added: List[str]
+    removed: List[str]
+
+
+@dataclass
+class FlightFareCell:
+    """Dataclass for one (outbound, return) cell of a lowest fare matrix."""
+
+    outbound_date: str
+    return_date: str
+    price: Optional[float] = None
+    currency: Optional[str] = None
+    status: Optional[int] = None
+    updated_at: Optional[float] = None
+    error: Any = None
+
+
+@dataclass
+class FlightWatchEntry:
+    """Dataclass for a search re-polled by a fare watcher every interval seconds."""
+
+    key: str
+    itinerary: List[SearchAvailabilityItinerary]
+    travelers: List[SearchAvailabilityPax]
+    only_carriers: Optional[List[str]] = None
+    options: Optional[SearchOptions] = None
+    interval: float = 3600.0
+
+
+@dataclass
+class FlightFareChange:
+    """Dataclass for a change of the lowest fare of a watched search."""
+
+    key: str
+    previous: Optional[float]
+    current: Optional[float]
+    currency: Optional[str]
+    observed_at: float
+
+
+@dataclass
+class FlightOfferGroup:
+    """Dataclass for the offers of a search that fly the same segments, cheapest first."""
+
+    fingerprint: str
+    offers: List[Any] = field(default_factory=list)
+    fare_fingerprints: List[str] = field(default_factory=list)
+
+    @property
+    def cheapest(self) -> Any:
+        """Cheapest offer of the group."""
+
+        return self.offers[0]
+
+    @property
+    def variants(self) -> List[Any]:
+        """Brand and fare alternatives to the cheapest offer, cheapest first."""
+
+        return self.offers[1:]
+
+
+@dataclass
+class FlightBrandOption:
+    """Dataclass for one branded fare option of an upsell response."""
+
+    brand: Optional[str]
+    label: Optional[str]
+    price: float
+    currency: Optional[str]
+    offer: Any
+
+
+@dataclass
+class FlightUpsellResults:
+    """Dataclass for the merged branded fare options of several offers, keyed by originating offer."""
+
+    options: Dict[str, List[FlightBrandOption]] = field(default_factory=dict)
+    errors: Dict[str, Any] = field(default_factory=dict)
+    calls: int = 0
+
+    @property
+    def complete(self) -> bool:
+        """Whether every offer got its options."""
+
+        return not self.errors
+
+
+@dataclass
+class FlightJobProgress:
+    """Dataclass for the progress and throughput of a bulk booking job."""
+
+    job_id: str
+    total: int
+    done: int = 0
+    failed: int = 0
+    in_doubt: int = 0
+    skipped: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def processed(self) -> int:
+        """Number of bookings that reached a final state in this run."""
+
+        return self.done + self.failed + self.in_doubt
+
+    @property
+    def throughput(self) -> float:
+        """Bookings processed per second in this run."""
+
+        return self.processed / self.elapsed if self.elapsed else 0.0
+
+
+@dataclass
+class FlightWarmUp:
+    """Dataclass for the outcome of FlightSDK.warm_up."""
+
+    host: Optional[str]
+    addresses: List[str] = field(default_factory=list)
+    connections: int = 0
+    token: bool = False
+    elapsed: float = 0.0
+
+
+@dataclass
+class FlightArchiveEntry:
+    """Dataclass for the index entry of an archived request: where its block is and what it is about."""
+
+    segment: str
+    offset: int
+    size: int
+    position: int
+    ama_client: Optional[str]
+    booking_id: Optional[str]
+    locator: Optional[str]
+    kind: Optional[FlightResultKind]
+    status: Optional[int]
+    start_time: Optional[float]
+
+
+@dataclass
+class FlightProfileStats:
+    """Dataclass for the CPU time, wall time and allocations of one phase of the sampled calls of a kind.
+
+    Times are in seconds and allocations in bytes; alloc_net and alloc_peak only cover the traced samples.
+    """
+
+    kind: Optional[FlightResultKind]
+    phase: FlightProfilePhase
+    samples: int = 0
+    traced: int = 0
+    cpu: float = 0.0
+    wall: float = 0.0
+    alloc_net: int = 0
+    alloc_peak: int = 0
+    alloc_peak_max: int = 0
+
+
+@dataclass
+class FlightRawResponse:
+    """Dataclass for an undecoded response returned by passthrough calls.
+
+    body is the full body for BYTES, or an iterator of chunks for STREAM (decompressed) and COMPRESSED_STREAM
+    (as sent on the wire, see content_encoding). Streams hold a pooled connection until consumed or closed.
+    """
+
+    status: int
+    headers: Any
+    mode: FlightPassthrough
+    body: Union[bytes, Iterator[bytes]]
+    content_encoding: Optional[str] = None
+    release: Optional[Callable[[], None]] = None
+
+    def close(self):
+        """Release the underlying connection."""
+
+        if self.release:
+            self.release()
@@ -1,4 +1,5 @@
 from enum import Enum
+from typing import Optional
 
 
 class FlightResultKind(Enum):
@@ -16,3 +17,107 @@ class FlightResultKind(Enum):
     FLIGHT_RESERVE = "FLIGHT_RESERVE"
     FLIGHT_BRANDED_FARE_UPSELL = "FLIGHT_BRANDED_FARE_UPSELL"
     FLIGHT_QUEUE_LIST = "FLIGHT_QUEUE_LIST"
+
+
+class FlightCabin(Enum):
+    """Enum for the cabin classes accepted by search filters."""
+
+    ECONOMY = "ECONOMY"
+    PREMIUM_ECONOMY = "PREMIUM_ECONOMY"
+    BUSINESS = "BUSINESS"
+    FIRST = "FIRST"
+
+
+class FlightFareType(Enum):
+    """Enum for the fare types accepted by search pricing options."""
+
+    PUBLISHED = "PUBLISHED"
+    NEGOTIATED = "NEGOTIATED"
+    CORPORATE = "CORPORATE"
+
+
+class FlightJobOperation(Enum):
+    """Enum for the booking operations a job runner can apply in bulk."""
+
+    ISSUE = "ISSUE"
+    CANCEL = "CANCEL"
+    COMMISSION = "COMMISSION"
+
+
+class FlightJobStepStatus(Enum):
+    """Enum for the journaled status of one booking within a job."""
+
+    STARTED = "STARTED"
+    DONE = "DONE"
+    FAILED = "FAILED"
+    IN_DOUBT = "IN_DOUBT"
+
+
+class FlightCircuitState(Enum):
+    """Enum for the states of an endpoint circuit breaker."""
+
+    CLOSED = "CLOSED"
+    OPEN = "OPEN"
+    HALF_OPEN = "HALF_OPEN"
+
+
+class FlightEndpointGroup(Enum):
+    """Enum for groups of endpoints that share concurrency limits and scheduling priority."""
+
+    AUTH = "AUTH"
+    SHOPPING = "SHOPPING"
+    PRICING = "PRICING"
+    BOOKING = "BOOKING"
+
+    @classmethod
+    def of(cls, kind: Optional[FlightResultKind]) -> "FlightEndpointGroup":
+        """Return the endpoint group of a kind of request; unknown kinds count as shopping traffic."""
+
+        return {
+            FlightResultKind.LOGIN: cls.AUTH,
+            FlightResultKind.FLIGHT_SEARCH: cls.SHOPPING,
+            FlightResultKind.FLIGHT_AVAILABILITIES: cls.SHOPPING,
+            FlightResultKind.FLIGHT_PRICING: cls.PRICING,
+            FlightResultKind.FLIGHT_BRANDED_FARE_UPSELL: cls.PRICING,
+            FlightResultKind.FLIGHT_RESERVE: cls.BOOKING,
+            FlightResultKind.FLIGHT_ISSUE: cls.BOOKING,
+            FlightResultKind.FLIGHT_CANCEL: cls.BOOKING,
+            FlightResultKind.FLIGHT_COMMISSION_BOOKING: cls.BOOKING,
+            FlightResultKind.FLIGHT_RETRIEVE_BY_ID: cls.BOOKING,
+            FlightResultKind.FLIGHT_RETRIEVE_BY_PNR: cls.BOOKING,
+            FlightResultKind.FLIGHT_QUEUE_LIST: cls.BOOKING,
+        }.get(kind, cls.SHOPPING)
+
+
+class FlightPassthrough(Enum):
+    """Enum for the raw response modes that skip JSON decoding."""
+
+    BYTES = "BYTES"
+    STREAM = "STREAM"
+    COMPRESSED_STREAM = "COMPRESSED_STREAM"
+
+
+class FlightOfferRejection(Enum):
+    """Enum for the reasons an offer is rejected locally before pricing or reserving it."""
+
+    TICKETING_DEADLINE_PASSED = "TICKETING_DEADLINE_PASSED"
+    DEPARTURE_TOO_SOON = "DEPARTURE_TOO_SOON"
+    NOT_ENOUGH_SEATS = "NOT_ENOUGH_SEATS"
+    SEARCH_TOO_OLD = "SEARCH_TOO_OLD"
+
+
+class FlightArchiveCodec(Enum):
+    """Enum for the block compression codecs of the metadata archive."""
+
+    GZIP = "GZIP"
+    ZSTD = "ZSTD"
+
+
+class FlightProfilePhase(Enum):
+    """Enum for the phases of an SDK call measured by the profiler."""
+
+    BUILD = "BUILD"
+    ENCODE = "ENCODE"
+    NETWORK = "NETWORK"
+    DECODE = "DECODE"
+    CALLBACK = "CALLBACK"
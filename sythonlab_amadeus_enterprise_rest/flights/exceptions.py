@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: exceptions.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+from typing import Any, List, Optional
+
+
+class FlightSDKError(Exception):
+    """Base class for errors raised by the flight SDK."""
+
+
+class FlightCircuitOpenError(FlightSDKError):
+    """Raised without calling Amadeus while the circuit breaker of an endpoint is open."""
+
+    def __init__(self, key: Any, retry_after: Optional[float] = None):
+        self.key = key
+        self.retry_after = retry_after
+        name = getattr(key, "value", key)
+        super().__init__(f"Circuit open for {name}, retry after {retry_after:.1f}s" if retry_after is not None
+                         else f"Circuit half-open for {name}, probe limit reached")
+
+
+class FlightOfferValidationError(FlightSDKError):
+    """Raised without calling Amadeus when an offer is known to fail pricing or reservation."""
+
+    def __init__(self, offer_id: Any, reasons: List[Any]):
+        self.offer_id = offer_id
+        self.reasons = reasons
+        super().__init__(f"Offer {offer_id} rejected locally: {', '.join(getattr(r, 'value', r) for r in reasons)}")
@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: fingerprints.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import hashlib
+import json
+from typing import Any, List
+
+
+def _digest(value: Any) -> str:
+    """Return a stable sha1 hex digest of a JSON-serializable value."""
+
+    encoded = json.dumps(value, sort_keys=True, separators=(",", ":"), default=str)
+
+    return hashlib.sha1(encoded.encode("utf-8")).hexdigest()
+
+
+def itinerary_segments(itinerary: Any) -> List[list]:
+    """Extract the flight identity of every segment of an itinerary."""
+
+    return [
+        [
+            segment.get("carrierCode"),
+            segment.get("number"),
+            segment.get("departure", {}).get("iataCode"),
+            segment.get("departure", {}).get("at"),
+            segment.get("arrival", {}).get("iataCode"),
+            segment.get("arrival", {}).get("at"),
+        ]
+        for segment in itinerary.get("segments", [])
+    ]
+
+
+def offer_segments(offer: Any) -> List[list]:
+    """Extract the flight identity of every segment of a flight offer, grouped by itinerary."""
+
+    return [itinerary_segments(itinerary) for itinerary in offer.get("itineraries", [])]
+
+
+def offer_fares(offer: Any) -> List[list]:
+    """Extract the fare basis, booking class and brand per traveler and segment of a flight offer."""
+
+    return [
+        [
+            pricing.get("travelerType"),
+            [
+                [
+                    fare.get("segmentId"),
+                    fare.get("fareBasis"),
+                    fare.get("class"),
+                    fare.get("brandedFare"),
+                ]
+                for fare in pricing.get("fareDetailsBySegment", [])
+            ]
+        ]
+        for pricing in offer.get("travelerPricings", [])
+    ]
+
+
+def offer_fingerprint(offer: Any) -> str:
+    """Build a stable fingerprint of a flight offer from its itineraries, segments and fare basis."""
+
+    return _digest([offer_segments(offer), offer_fares(offer)])
+
+
+def itinerary_fingerprint(itinerary: Any) -> str:
+    """Build a stable fingerprint of a single itinerary (bound) from the flights it is made of."""
+
+    return _digest(itinerary_segments(itinerary))
+
+
+def segments_fingerprint(offer: Any) -> str:
+    """Build a stable fingerprint of the flight set of an offer, shared by all its brand and fare variants."""
+
+    return _digest(offer_segments(offer))
+
+
+def fare_fingerprint(offer: Any) -> str:
+    """Build a stable fingerprint of the fares of an offer, independent of the flights they apply to."""
+
+    return _digest(offer_fares(offer))
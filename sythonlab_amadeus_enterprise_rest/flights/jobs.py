@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: jobs.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from sythonlab_amadeus_enterprise_rest.core.enums import CommissionType
+from sythonlab_amadeus_enterprise_rest.flights.concurrency import RateLimiter, bounded_map, call_with_retries, \
+    RETRYABLE_STATUSES, UNPROCESSED_STATUSES
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import FlightJobProgress
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightJobOperation, FlightJobStepStatus
+from sythonlab_amadeus_enterprise_rest.flights.transports import TRANSPORT_ERRORS
+
+logger = logging.getLogger(__name__)
+
+IDEMPOTENT_OPERATIONS = frozenset({FlightJobOperation.CANCEL, FlightJobOperation.COMMISSION})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS flight_job_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    job_id TEXT NOT NULL,
+    booking_id TEXT NOT NULL,
+    operation TEXT NOT NULL,
+    status TEXT NOT NULL,
+    http_status INTEGER,
+    detail TEXT,
+    created_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS flight_job_events_job ON flight_job_events (job_id, booking_id);
+"""
+
+
+class FlightJobJournal:
+    """Append-only sqlite (WAL) journal of the steps of bulk booking jobs."""
+
+    def __init__(self, path: str):
+        """Open (or create) the journal at path."""
+
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        # FULL, not NORMAL: a STARTED event lost to a power failure would let a ticket be issued twice.
+        self._connection.execute("PRAGMA synchronous=FULL")
+        self._connection.executescript(SCHEMA)
+
+    def append(self, job_id: str, booking_id: str, operation: FlightJobOperation, status: FlightJobStepStatus,
+               http_status: Optional[int] = None, detail: Any = None):
+        """Record a step event; events are never updated or deleted."""
+
+        with self._lock:
+            self._connection.execute(
+                "INSERT INTO flight_job_events "
+                "(job_id, booking_id, operation, status, http_status, detail, created_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (job_id, booking_id, operation.value, status.value, http_status,
+                 json.dumps(detail, default=str) if detail is not None else None, time.time())
+            )
+
+    def states(self, job_id: str) -> Dict[str, FlightJobStepStatus]:
+        """Return the latest journaled status of every booking of a job."""
+
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT booking_id, status FROM flight_job_events WHERE id IN "
+                "(SELECT MAX(id) FROM flight_job_events WHERE job_id = ? GROUP BY booking_id)",
+                (job_id,)
+            ).fetchall()
+
+        return {booking_id: FlightJobStepStatus(status) for booking_id, status in rows}
+
+    def close(self):
+        """Close the underlying sqlite connection."""
+
+        with self._lock:
+            self._connection.close()
+
+
+class FlightJobRunner:
+    """Run issue, cancel or commission operations over many bookings, resumable from a persistent journal.
+
+    Bookings already DONE in the journal are skipped. A non-idempotent step (issuance) that was STARTED but never
+    finished, or that ended with a 5xx or connection error, is marked IN_DOUBT and never re-run automatically:
+    it has to be reconciled, for example with retrieve_by_booking_id. A cancellation answered with 404 after an
+    attempt that may have reached Amadeus (a retry, or one left STARTED or IN_DOUBT by an earlier run) is DONE,
+    not FAILED.
+    """
+
+    def __init__(
+            self,
+            sdk: Any,
+            journal: FlightJobJournal,
+            *,
+            max_workers: int = 4,
+            rate: Optional[float] = None,
+            retries: int = 2,
+            backoff: float = 0.5
+    ):
+        """Initialize the runner with a FlightSDK, a journal, a concurrency cap and an optional calls per second."""
+
+        self.sdk = sdk
+        self.journal = journal
+        self.max_workers = max_workers
+        self.limiter = RateLimiter(rate) if rate else None
+        self.retries = retries
+        self.backoff = backoff
+
+    def run(
+            self,
+            *,
+            job_id: str,
+            operation: FlightJobOperation,
+            booking_ids: Iterable[str],
+            commission_type: Optional[CommissionType] = None,
+            value: Optional[float] = None,
+            retry_failed: bool = False,
+            on_progress: Optional[Callable[[FlightJobProgress], None]] = None,
+            on_complete: Optional[Callable] = None
+    ) -> FlightJobProgress:
+        """Apply the operation to every booking of the job that is not already finished and report the progress."""
+
+        if operation == FlightJobOperation.COMMISSION and (commission_type is None or value is None):
+            raise ValueError("commission_type and value are required for commission jobs")
+
+        booking_ids = list(dict.fromkeys(booking_ids))
+        states = self.journal.states(job_id)
+        idempotent = operation in IDEMPOTENT_OPERATIONS
+        progress = FlightJobProgress(job_id=job_id, total=len(booking_ids))
+        start = time.monotonic()
+        pending = []
+
+        for booking_id in booking_ids:
+            state = states.get(booking_id)
+
+            if state == FlightJobStepStatus.STARTED and not idempotent:
+                self.journal.append(job_id, booking_id, operation, FlightJobStepStatus.IN_DOUBT,
+                                    detail="interrupted before completion")
+                state = FlightJobStepStatus.IN_DOUBT
+
+            if state == FlightJobStepStatus.DONE or (state == FlightJobStepStatus.IN_DOUBT and not idempotent) \
+                    or (state == FlightJobStepStatus.FAILED and not retry_failed):
+                progress.skipped += 1
+                continue
+
+            pending.append(booking_id)
+
+        def call(booking_id: str):
+            if operation == FlightJobOperation.ISSUE:
+                return self.sdk.issue_booking(booking_id=booking_id, on_complete=on_complete)
+            if operation == FlightJobOperation.CANCEL:
+                return self.sdk.cancel_booking(booking_id=booking_id, on_complete=on_complete)
+            return self.sdk.fm_commission_booking(booking_id=booking_id, commission_type=commission_type,
+                                                  value=value, on_complete=on_complete)
+
+        def limited_call(booking_id: str):
+            if self.limiter:
+                self.limiter.acquire()
+            return call(booking_id)
+
+        def on_retry(attempt: int, outcome: Any):
+            if outcome == 401:
+                self.sdk.invalidate_token()
+
+        def step(booking_id: str) -> FlightJobStepStatus:
+            # Whether an earlier attempt on this booking may already have reached Amadeus: one interrupted or in
+            # doubt in a previous run, or one retried in this step. A FAILED attempt was answered and not applied.
+            attempted = [states.get(booking_id) in (FlightJobStepStatus.STARTED, FlightJobStepStatus.IN_DOUBT)]
+
+            def on_step_retry(attempt: int, outcome: Any):
+                attempted[0] = True
+                on_retry(attempt, outcome)
+
+            self.journal.append(job_id, booking_id, operation, FlightJobStepStatus.STARTED)
+
+            try:
+                status, data = call_with_retries(
+                    lambda: limited_call(booking_id),
+                    retries=self.retries,
+                    backoff=self.backoff,
+                    retry_on=TRANSPORT_ERRORS if idempotent else (),
+                    retry_statuses=RETRYABLE_STATUSES if idempotent else UNPROCESSED_STATUSES,
+                    on_retry=on_step_retry
+                )
+            except Exception as error:
+                final = FlightJobStepStatus.FAILED if idempotent else FlightJobStepStatus.IN_DOUBT
+                self.journal.append(job_id, booking_id, operation, final, detail=repr(error))
+                return final
+
+            if 200 <= status < 300:
+                final = FlightJobStepStatus.DONE
+            elif status == 404 and operation == FlightJobOperation.CANCEL and attempted[0]:
+                self.journal.append(job_id, booking_id, operation, FlightJobStepStatus.DONE, http_status=status,
+                                    detail="already cancelled by an earlier attempt")
+                return FlightJobStepStatus.DONE
+            elif status >= 500 and not idempotent:
+                final = FlightJobStepStatus.IN_DOUBT
+            else:
+                final = FlightJobStepStatus.FAILED
+
+            self.journal.append(job_id, booking_id, operation, final, http_status=status,
+                                detail=None if final == FlightJobStepStatus.DONE else data)
+            return final
+
+        if not pending:
+            return progress
+
+        with self.sdk.shared_token(on_complete=on_complete):
+            for booking_id, final in bounded_map(step, pending, max_workers=self.max_workers):
+                if final == FlightJobStepStatus.DONE:
+                    progress.done += 1
+                elif final == FlightJobStepStatus.IN_DOUBT:
+                    progress.in_doubt += 1
+                else:
+                    if isinstance(final, Exception):
+                        logger.error("Job %s step for %s crashed: %r", job_id, booking_id, final)
+                    progress.failed += 1
+
+                progress.elapsed = time.monotonic() - start
+
+                if on_progress:
+                    on_progress(progress)
+
+        progress.elapsed = time.monotonic() - start
+
+        logger.info("Job %s %s: %s done, %s failed, %s in doubt, %s skipped in %.1fs (%.2f/s)", job_id,
+                    operation.value, progress.done, progress.failed, progress.in_doubt, progress.skipped,
+                    progress.elapsed, progress.throughput)
+
+        return progress
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: limits.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import threading
+import time
+from collections import deque
+from typing import Callable, Dict, Optional
+
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightEndpointGroup
+
+
+class AdaptiveLimiter:
+    """AIMD concurrency limiter per endpoint group.
+
+    The allowed number of in-flight requests of a group grows by one per round of successful calls while latency
+    stays within latency_tolerance times the baseline (the lowest latency of the recent window), and is cut by
+    backoff_ratio on 429, 5xx, connection errors or latency inflation.
+    """
+
+    def __init__(
+            self,
+            *,
+            initial_limit: int = 8,
+            min_limit: int = 1,
+            max_limit: int = 64,
+            backoff_ratio: float = 0.5,
+            latency_tolerance: float = 2.0,
+            window: int = 100,
+            on_change: Optional[Callable[[FlightEndpointGroup, float], None]] = None
+    ):
+        """Initialize the limiter; on_change(group, limit) is called whenever a group limit changes."""
+
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.window = window
+        self.on_change = on_change
+        self._groups: Dict[FlightEndpointGroup, Dict] = {}
+        self._condition = threading.Condition()
+
+    def limit(self, group: FlightEndpointGroup) -> int:
+        """Return the current number of in-flight requests allowed for a group."""
+
+        with self._condition:
+            return int(self._group(group)["limit"])
+
+    def in_flight(self, group: FlightEndpointGroup) -> int:
+        """Return the current number of in-flight requests of a group."""
+
+        with self._condition:
+            return self._group(group)["in_flight"]
+
+    def snapshot(self) -> Dict[str, Dict[str, float]]:
+        """Return the live limit, in-flight count and baseline latency of every group."""
+
+        with self._condition:
+            return {
+                group.value: {
+                    "limit": int(state["limit"]),
+                    "in_flight": state["in_flight"],
+                    "baseline": min(state["latencies"]) if state["latencies"] else None,
+                }
+                for group, state in self._groups.items()
+            }
+
+    def acquire(self, group: FlightEndpointGroup, timeout: Optional[float] = None) -> bool:
+        """Wait for an in-flight slot of the group; returns False if the timeout expires first."""
+
+        with self._condition:
+            state = self._group(group)
+
+            if not self._condition.wait_for(lambda: state["in_flight"] < int(state["limit"]), timeout=timeout):
+                return False
+
+            state["in_flight"] += 1
+            return True
+
+    def release(self, group: FlightEndpointGroup, *, status: Optional[int], latency: float):
+        """Free a slot and adapt the group limit to the outcome; status is None when the call raised."""
+
+        with self._condition:
+            state = self._group(group)
+            state["in_flight"] -= 1
+            previous = int(state["limit"])
+            baseline = min(state["latencies"]) if state["latencies"] else latency
+            state["latencies"].append(latency)
+            now = time.monotonic()
+
+            if status is None or status == 429 or status >= 500 or latency > baseline * self.latency_tolerance:
+                # Back off at most once per baseline round trip so a burst of errors does not collapse the limit.
+                if now - state["decreased_at"] >= baseline:
+                    state["limit"] = max(self.min_limit, state["limit"] * self.backoff_ratio)
+                    state["decreased_at"] = now
+            else:
+                state["limit"] = min(self.max_limit, state["limit"] + 1 / state["limit"])
+
+            current = int(state["limit"])
+            self._condition.notify_all()
+
+        if current != previous and self.on_change:
+            self.on_change(group, current)
+
+    def _group(self, group: FlightEndpointGroup) -> Dict:
+        """Return the state of a group, creating it at the initial limit. The condition lock must be held."""
+
+        state = self._groups.get(group)
+
+        if state is None:
+            state = self._groups[group] = {
+                "limit": float(self.initial_limit),
+                "in_flight": 0,
+                "latencies": deque(maxlen=self.window),
+                "decreased_at": 0.0,
+            }
+
+        return state
@@ -0,0 +1,197 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: matrix.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import logging
+import math
+import time
+from datetime import date, timedelta
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sythonlab_amadeus_enterprise_rest.flights.concurrency import bounded_map, call_with_retries
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax, \
+    SearchOptions, FlightFareCell
+from sythonlab_amadeus_enterprise_rest.flights.offers import offer_price, PRICE_PROJECTION
+from sythonlab_amadeus_enterprise_rest.flights.transports import TRANSPORT_ERRORS
+
+logger = logging.getLogger(__name__)
+
+
+def date_window(center: str, days: int) -> List[str]:
+    """Return the ISO dates from days before to days after center."""
+
+    start = date.fromisoformat(center)
+
+    return [(start + timedelta(days=offset)).isoformat() for offset in range(-days, days + 1)]
+
+
+class FareMatrix:
+    """Lowest round trip fare per (outbound, return) date pair, refreshed incrementally.
+
+    Every cell keeps the minimum grandTotal of its search and the time it was obtained. refresh() only searches
+    the cells that are missing or older than ttl seconds, concurrently and on a single access token, so a calendar
+    view can call it on every render. Cells whose return date is before the outbound date are never searched.
+    """
+
+    def __init__(
+            self,
+            sdk: Any,
+            *,
+            origin: str,
+            destination: str,
+            outbound_dates: List[str],
+            return_dates: List[str],
+            travelers: List[SearchAvailabilityPax],
+            only_carriers: Optional[List[str]] = None,
+            options: Optional[SearchOptions] = None,
+            ttl: float = 900.0,
+            max_workers: int = 8,
+            retries: int = 2,
+            backoff: float = 0.5
+    ):
+        """Initialize the matrix for a route, its date windows and a passenger mix of the given FlightSDK."""
+
+        self.sdk = sdk
+        self.origin = origin
+        self.destination = destination
+        self.outbound_dates = list(outbound_dates)
+        self.return_dates = list(return_dates)
+        self.travelers = travelers
+        self.only_carriers = only_carriers
+        self.options = options
+        self.ttl = ttl
+        self.max_workers = max_workers
+        self.retries = retries
+        self.backoff = backoff
+        self.cells: Dict[Tuple[str, str], FlightFareCell] = {
+            (outbound, inbound): FlightFareCell(outbound_date=outbound, return_date=inbound)
+            for outbound in self.outbound_dates
+            for inbound in self.return_dates
+            if inbound >= outbound
+        }
+
+    @classmethod
+    def around(cls, sdk: Any, *, departure_date: str, return_date: str, days: int = 3, **kwargs) -> "FareMatrix":
+        """Build a matrix of days before and after the given departure and return dates (7x7 by default)."""
+
+        return cls(
+            sdk,
+            outbound_dates=date_window(departure_date, days),
+            return_dates=date_window(return_date, days),
+            **kwargs
+        )
+
+    def cell(self, outbound_date: str, return_date: str) -> Optional[FlightFareCell]:
+        """Return the cell of a date pair, or None if the pair is not searchable."""
+
+        return self.cells.get((outbound_date, return_date))
+
+    def stale(self, now: Optional[float] = None) -> List[FlightFareCell]:
+        """Return the cells never searched, failed or older than ttl."""
+
+        now = time.time() if now is None else now
+
+        return [
+            cell for cell in self.cells.values()
+            if cell.updated_at is None or cell.error is not None or now - cell.updated_at >= self.ttl
+        ]
+
+    def refresh(self, *, force: bool = False, on_complete: Optional[Callable] = None) -> int:
+        """Search the stale cells (every cell if force) and return how many were refreshed.
+
+        A failed search keeps the previous price of its cell and records the error, so it is retried on the
+        next refresh.
+        """
+
+        cells = list(self.cells.values()) if force else self.stale()
+
+        if not cells:
+            return 0
+
+        def on_retry(attempt: int, outcome: Any):
+            if outcome == 401:
+                self.sdk.invalidate_token()
+
+        def search(cell: FlightFareCell):
+            return call_with_retries(
+                lambda: self.sdk.search_availability(
+                    itinerary=[
+                        SearchAvailabilityItinerary(
+                            id="1",
+                            origin_location_code=self.origin,
+                            destination_location_code=self.destination,
+                            departure_date=cell.outbound_date
+                        ),
+                        SearchAvailabilityItinerary(
+                            id="2",
+                            origin_location_code=self.destination,
+                            destination_location_code=self.origin,
+                            departure_date=cell.return_date
+                        ),
+                    ],
+                    travelers=self.travelers,
+                    only_carriers=self.only_carriers,
+                    options=self.options,
+                    projection=PRICE_PROJECTION,
+                    on_complete=on_complete
+                ),
+                retries=self.retries,
+                backoff=self.backoff,
+                retry_on=TRANSPORT_ERRORS,
+                on_retry=on_retry
+            )
+
+        refreshed = 0
+
+        with self.sdk.shared_token(on_complete=on_complete):
+            for cell, result in bounded_map(search, cells, max_workers=self.max_workers):
+                if isinstance(result, Exception):
+                    logger.warning("Fare matrix search %s/%s failed: %r", cell.outbound_date, cell.return_date,
+                                   result)
+                    cell.error = result
+                    continue
+
+                status, data = result
+
+                if status != 200:
+                    cell.status, cell.error = status, data
+                    continue
+
+                offers = (data or {}).get("data", [])
+                cheapest = min(offers, key=offer_price, default=None)
+                price = offer_price(cheapest) if cheapest is not None else math.inf
+
+                # Offers without a parsable grandTotal price as infinity: the cell is left without a fare.
+                if math.isinf(price):
+                    cheapest = None
+
+                cell.status = status
+                cell.error = None
+                cell.price = price if cheapest is not None else None
+                cell.currency = cheapest.get("price", {}).get("currency") if cheapest is not None else None
+                cell.updated_at = time.time()
+                refreshed += 1
+
+        return refreshed
+
+    def table(self) -> List[List[Optional[float]]]:
+        """Return the prices as rows of outbound dates by columns of return dates; None where unknown."""
+
+        return [
+            [
+                self.cells[(outbound, inbound)].price if (outbound, inbound) in self.cells else None
+                for inbound in self.return_dates
+            ]
+            for outbound in self.outbound_dates
+        ]
+
+    def cheapest(self) -> Optional[FlightFareCell]:
+        """Return the cell with the lowest known price."""
+
+        priced = [cell for cell in self.cells.values() if cell.price is not None]
+
+        return min(priced, key=lambda cell: cell.price, default=None)
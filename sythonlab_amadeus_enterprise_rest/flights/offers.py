@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: offers.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+from bisect import bisect_left, bisect_right
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import FlightOfferGroup, FlightBrandOption
+from sythonlab_amadeus_enterprise_rest.flights.fingerprints import segments_fingerprint, fare_fingerprint
+
+# Projection decoding only the price of each offer, for callers that just compare fares.
+PRICE_PROJECTION = ["data.price.grandTotal", "data.price.currency"]
+
+
+def offer_price(offer: Any) -> float:
+    """Return the grand total of a flight offer, or infinity when it has none."""
+
+    try:
+        return float(offer["price"]["grandTotal"])
+    except (KeyError, TypeError, ValueError):
+        return float("inf")
+
+
+def offer_brand(offer: Any) -> Tuple[Optional[str], Optional[str]]:
+    """Return the branded fare code and label of the first fare of an offer."""
+
+    for pricing in offer.get("travelerPricings", []):
+        for fare in pricing.get("fareDetailsBySegment", []):
+            return fare.get("brandedFare"), fare.get("brandedFareLabel")
+
+    return None, None
+
+
+def brand_options(offers: Iterable[Any]) -> List[FlightBrandOption]:
+    """Normalize the offers of an upsell response into branded fare options, one per fare set, cheapest first."""
+
+    options: Dict[str, FlightBrandOption] = {}
+
+    for offer in offers:
+        fingerprint = fare_fingerprint(offer)
+        price = offer_price(offer)
+
+        if fingerprint in options and options[fingerprint].price <= price:
+            continue
+
+        brand, label = offer_brand(offer)
+        options[fingerprint] = FlightBrandOption(brand=brand, label=label, price=price,
+                                                 currency=offer.get("price", {}).get("currency"), offer=offer)
+
+    return sorted(options.values(), key=lambda option: option.price)
+
+
+class OfferIndex:
+    """Index of flight offers grouped by flight set.
+
+    Each offer is fingerprinted once and hashed into its group, and duplicate fares are found with a dict lookup,
+    so no offers are compared pairwise. Within a group, offers are kept sorted by price: the insert position is
+    found by binary search, and the list insert costs a memmove proportional to the size of the group. Offers
+    repeating both the segments and the fares of one already indexed are dropped as duplicates, keeping the
+    cheaper one. Group fingerprints match segments_fingerprint and can be used as cache keys downstream.
+    """
+
+    def __init__(self, offers: Optional[Iterable[Any]] = None):
+        """Initialize the index, optionally adding the given offers."""
+
+        self._groups: Dict[str, FlightOfferGroup] = {}
+        self._prices: Dict[str, List[float]] = {}
+        self._fares: Dict[str, Dict[str, float]] = {}
+        self.duplicates = 0
+
+        if offers is not None:
+            self.extend(offers)
+
+    @classmethod
+    def from_response(cls, data: Any) -> "OfferIndex":
+        """Build an index from a search_availability or search_availabilities response."""
+
+        return cls((data or {}).get("data", []))
+
+    def add(self, offer: Any) -> FlightOfferGroup:
+        """Add an offer to its flight set group and return the group."""
+
+        fingerprint = segments_fingerprint(offer)
+        fare = fare_fingerprint(offer)
+        price = offer_price(offer)
+        group = self._groups.get(fingerprint)
+
+        if group is None:
+            group = self._groups[fingerprint] = FlightOfferGroup(fingerprint=fingerprint)
+            self._prices[fingerprint] = []
+            self._fares[fingerprint] = {}
+
+        prices = self._prices[fingerprint]
+        fares = self._fares[fingerprint]
+
+        if fare in fares:
+            self.duplicates += 1
+
+            if fares[fare] <= price:
+                return group
+
+            position = bisect_left(prices, fares[fare])
+
+            while group.fare_fingerprints[position] != fare:
+                position += 1
+
+            del prices[position], group.offers[position], group.fare_fingerprints[position]
+
+        fares[fare] = price
+        position = bisect_right(prices, price)
+        prices.insert(position, price)
+        group.offers.insert(position, offer)
+        group.fare_fingerprints.insert(position, fare)
+
+        return group
+
+    def extend(self, offers: Iterable[Any]):
+        """Add every given offer."""
+
+        for offer in offers:
+            self.add(offer)
+
+    def get(self, fingerprint: str) -> Optional[FlightOfferGroup]:
+        """Return the group of a flight set fingerprint."""
+
+        return self._groups.get(fingerprint)
+
+    def group_of(self, offer: Any) -> Optional[FlightOfferGroup]:
+        """Return the group an offer belongs to."""
+
+        return self._groups.get(segments_fingerprint(offer))
+
+    def groups(self) -> List[FlightOfferGroup]:
+        """Return every group, cheapest first."""
+
+        return sorted(self._groups.values(), key=lambda group: self._prices[group.fingerprint][0])
+
+    def cheapest(self) -> List[Any]:
+        """Return the cheapest offer of every flight set, cheapest first."""
+
+        return [group.cheapest for group in self.groups()]
+
+    def __len__(self) -> int:
+        """Number of distinct flight sets."""
+
+        return len(self._groups)
+
+    def __iter__(self) -> Iterator[FlightOfferGroup]:
+        """Iterate over the groups, cheapest first."""
+
+        return iter(self.groups())
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: offload.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import json
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Any, Callable, List, Optional
+
+from sythonlab_amadeus_enterprise_rest.flights.projection import ProjectionDecoder
+
+
+def decode_body(body: bytes, projection: Optional[List[str]] = None,
+                transform: Optional[Callable[[Any], Any]] = None) -> Any:
+    """Decode a JSON body, keeping only the projected paths if given, and apply transform to the result."""
+
+    data = ProjectionDecoder(projection).decode(body) if projection else json.loads(body)
+
+    return transform(data) if transform is not None else data
+
+
+def _decode_shared(name: str, size: int, projection: Optional[List[str]],
+                   transform: Optional[Callable[[Any], Any]]) -> Any:
+    """Worker entry point: decode a body placed in shared memory by the parent process."""
+
+    block = shared_memory.SharedMemory(name=name)
+
+    try:
+        body = bytes(block.buf[:size])
+    finally:
+        block.close()
+
+    return decode_body(body, projection, transform)
+
+
+class DecodeOffload:
+    """Decode and post-process large response bodies in a pool of worker processes.
+
+    The calling thread waits without holding the GIL, so other request threads and event loops keep running
+    while a multi-MB body is parsed. Bodies under min_size bytes are decoded in process, where the round trip would
+    cost more than it saves, and bodies of at least shm_threshold bytes reach the worker through shared memory
+    instead of the pool pipe. Only the decoded (and projected or transformed) result comes back: pair the pool with
+    a projection or with a transform that filters or ranks the offers, since unpickling a full response in the
+    caller costs about as much as decoding it. transform must be picklable, i.e. a module-level function.
+    """
+
+    def __init__(self, *, max_workers: Optional[int] = None, min_size: int = 256 * 1024,
+                 shm_threshold: int = 1024 * 1024, mp_context: Any = None):
+        """Initialize the worker pool; bodies under min_size bytes are decoded in the calling process."""
+
+        self.min_size = min_size
+        self.shm_threshold = shm_threshold
+        self.offloaded = 0
+        self._lock = threading.Lock()
+        self._executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=mp_context)
+
+    def submit(self, body: bytes, *, projection: Optional[List[str]] = None,
+               transform: Optional[Callable[[Any], Any]] = None) -> Future:
+        """Decode a body on the pool and return a future of the result."""
+
+        with self._lock:
+            self.offloaded += 1
+
+        if len(body) < self.shm_threshold:
+            return self._executor.submit(decode_body, body, projection, transform)
+
+        block = shared_memory.SharedMemory(create=True, size=len(body))
+        block.buf[:len(body)] = body
+
+        try:
+            future = self._executor.submit(_decode_shared, block.name, len(body), projection, transform)
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+
+        def release(_):
+            block.close()
+            block.unlink()
+
+        future.add_done_callback(release)
+
+        return future
+
+    def decode(self, body: bytes, *, projection: Optional[List[str]] = None,
+               transform: Optional[Callable[[Any], Any]] = None) -> Any:
+        """Decode a body, on the pool if it is at least min_size bytes, and wait for the result."""
+
+        if len(body) < self.min_size:
+            return decode_body(body, projection, transform)
+
+        return self.submit(body, projection=projection, transform=transform).result()
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes."""
+
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,316 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: profiling.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import functools
+import random
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from dataclasses import replace
+from typing import Callable, Dict, List, Optional, Tuple
+
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import FlightProfileStats
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightProfilePhase, FlightResultKind
+
+FOLDED_METRICS = ("cpu", "wall", "alloc")
+
+
+def profiled(method: Callable) -> Callable:
+    """Profile a FlightSDK method as one call, including its payload building, when the SDK has a profiler."""
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.profiler is None:
+            return method(self, *args, **kwargs)
+
+        with self.profiler.call():
+            return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+class ProfiledCall:
+    """Profiling state of the call in progress on one thread."""
+
+    __slots__ = ("implicit", "sampled", "traced", "started_tracing", "kind", "phase", "cpu", "wall", "memory")
+
+    def __init__(self, *, implicit: bool, sampled: bool):
+        self.implicit = implicit
+        self.sampled = sampled
+        self.traced = False
+        self.started_tracing = False
+        self.kind: Optional[FlightResultKind] = None
+        self.phase: Optional[FlightProfilePhase] = None
+        self.cpu = 0.0
+        self.wall = 0.0
+        self.memory = 0
+
+
+class FlightProfiler:
+    """Sampled CPU and allocation profiling of SDK calls, aggregated per FlightResultKind and phase.
+
+    A sampled request is split into BUILD (payload building, from the start of the SDK method or the end of its
+    previous request, e.g. the login, so waiting for a login made by another thread counts too), ENCODE (headers
+    and JSON body), NETWORK (limiter and scheduler queueing, hedging and the transport), DECODE (JSON, projection,
+    offload or passthrough wrapping) and CALLBACK (capture and on_complete). Each phase records the CPU time of the
+    calling thread and its wall time. With trace_allocations, tracemalloc also measures the net and peak
+    allocations of every phase. Tracing is process-wide, so only one sampled call is traced at a time (the others
+    are only timed) and allocations made by other threads meanwhile are counted too. tracemalloc is stopped after
+    each traced call unless it was already running, and its peak is reset between phases.
+    """
+
+    def __init__(self, *, sample_rate: float = 1.0, trace_allocations: bool = True, frames: int = 1):
+        """Initialize the profiler sampling sample_rate (0..1) of the calls."""
+
+        self.sample_rate = sample_rate
+        self.trace_allocations = trace_allocations
+        self.frames = frames
+        self._stats: Dict[Tuple[Optional[FlightResultKind], FlightProfilePhase], FlightProfileStats] = {}
+        self._lock = threading.Lock()
+        self._trace_lock = threading.Lock()
+        self._local = threading.local()
+
+    @contextmanager
+    def call(self):
+        """Profile the requests made by the calling thread inside the block as one call, if sampled."""
+
+        current = getattr(self._local, "call", None)
+
+        if current is not None and not current.implicit:
+            yield
+            return
+
+        if current is not None:
+            self._end(current)
+
+        call = self._begin(implicit=False)
+
+        try:
+            yield
+        finally:
+            self._end(call)
+
+    def sampled(self) -> bool:
+        """Whether the request in progress on the calling thread is sampled."""
+
+        call = getattr(self._local, "call", None)
+
+        return call is not None and call.sampled
+
+    @contextmanager
+    def request(self, kind: Optional[FlightResultKind]):
+        """Profile one request of the calling thread; if it raises, its open phase is dropped and tracing released."""
+
+        self.start_request(kind)
+
+        try:
+            yield
+        except BaseException:
+            self.abort_request()
+            raise
+
+        self.finish_request()
+
+    def start_request(self, kind: Optional[FlightResultKind]):
+        """End the BUILD phase of the calling thread's call, or begin a call for a bare request, and open ENCODE."""
+
+        call = getattr(self._local, "call", None)
+
+        if call is None or call.implicit:
+            if call is not None:
+                self._end(call)
+
+            call = self._begin(implicit=True)
+
+        call.kind = kind
+
+        if call.sampled:
+            self._switch(call, FlightProfilePhase.ENCODE)
+
+    def enter(self, phase: FlightProfilePhase):
+        """Close the current phase of the calling thread's request and open the given one."""
+
+        call = getattr(self._local, "call", None)
+
+        if call is not None and call.sampled:
+            self._switch(call, phase)
+
+    def finish_request(self):
+        """Close the last phase of the calling thread's request and start measuring the BUILD of the next one."""
+
+        call = getattr(self._local, "call", None)
+
+        if call is None:
+            return
+
+        if call.implicit:
+            self._end(call, record=True)
+        elif call.sampled:
+            self._switch(call, FlightProfilePhase.BUILD)
+
+    def abort_request(self):
+        """Drop the open phase of the calling thread's failed request, ending its call if the request was bare."""
+
+        call = getattr(self._local, "call", None)
+
+        if call is None:
+            return
+
+        if call.implicit:
+            self._end(call)
+        elif call.sampled:
+            call.phase = None
+            self._open(call, FlightProfilePhase.BUILD)
+
+    def stats(self) -> List[FlightProfileStats]:
+        """Return a copy of the aggregated statistics, by kind and phase."""
+
+        with self._lock:
+            return [replace(stats) for stats in self._stats.values()]
+
+    def reset(self):
+        """Drop the aggregated statistics."""
+
+        with self._lock:
+            self._stats.clear()
+
+    def report(self) -> str:
+        """Return the aggregated statistics as a text table of per-sample averages."""
+
+        lines = [f"{'kind':<28} {'phase':<9} {'samples':>8} {'cpu ms':>9} {'wall ms':>9} {'net KiB':>9} "
+                 f"{'peak KiB':>9} {'max KiB':>9}"]
+
+        for stats in sorted(self.stats(), key=lambda item: (self.kind_name(item.kind),
+                                                            list(FlightProfilePhase).index(item.phase))):
+            traced = stats.traced or 1
+            lines.append(
+                f"{self.kind_name(stats.kind):<28} {stats.phase.value:<9} {stats.samples:>8} "
+                f"{stats.cpu / stats.samples * 1000:>9.3f} {stats.wall / stats.samples * 1000:>9.3f} "
+                f"{stats.alloc_net / traced / 1024:>9.1f} {stats.alloc_peak / traced / 1024:>9.1f} "
+                f"{stats.alloc_peak_max / 1024:>9.1f}"
+            )
+
+        return "\n".join(lines)
+
+    def folded(self, metric: str = "cpu") -> str:
+        """Return the statistics as folded stacks for flame graph tools (flamegraph.pl, speedscope, inferno).
+
+        metric is "cpu" or "wall" (total microseconds) or "alloc" (total peak bytes of the traced samples).
+        """
+
+        if metric not in FOLDED_METRICS:
+            raise ValueError(f"Unsupported metric: {metric}")
+
+        lines = []
+
+        for stats in self.stats():
+            if metric == "alloc":
+                value = stats.alloc_peak
+            else:
+                value = round((stats.cpu if metric == "cpu" else stats.wall) * 1_000_000)
+
+            if value > 0:
+                lines.append(f"FlightSDK;{self.kind_name(stats.kind)};{stats.phase.value} {value}")
+
+        return "\n".join(sorted(lines))
+
+    @staticmethod
+    def kind_name(kind: Optional[FlightResultKind]) -> str:
+        """Name of a kind in reports, including requests without one."""
+
+        return kind.value if kind is not None else "UNKNOWN"
+
+    def _begin(self, *, implicit: bool) -> ProfiledCall:
+        """Start a call on the calling thread, deciding whether it is sampled and traced."""
+
+        call = ProfiledCall(implicit=implicit,
+                            sampled=self.sample_rate >= 1 or random.random() < self.sample_rate)
+
+        if call.sampled and self.trace_allocations and self._trace_lock.acquire(blocking=False):
+            call.traced = True
+
+            if not tracemalloc.is_tracing():
+                tracemalloc.start(self.frames)
+                call.started_tracing = True
+
+        self._local.call = call
+
+        if call.sampled and not implicit:
+            self._open(call, FlightProfilePhase.BUILD)
+
+        return call
+
+    def _end(self, call: ProfiledCall, *, record: bool = False):
+        """End a call, recording its open phase only if record is set, and release the tracing."""
+
+        if record:
+            self._close(call)
+
+        if call.started_tracing:
+            tracemalloc.stop()
+
+        if call.traced:
+            self._trace_lock.release()
+
+        call.phase = None
+        call.sampled = call.traced = call.started_tracing = False
+
+        if getattr(self._local, "call", None) is call:
+            self._local.call = None
+
+    def _switch(self, call: ProfiledCall, phase: FlightProfilePhase):
+        """Close the open phase of a call and open the next one."""
+
+        self._close(call)
+        self._open(call, phase)
+
+    def _open(self, call: ProfiledCall, phase: FlightProfilePhase):
+        """Start measuring a phase."""
+
+        call.phase = phase
+
+        if call.traced:
+            call.memory = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+
+        call.cpu = time.thread_time()
+        call.wall = time.perf_counter()
+
+    def _close(self, call: ProfiledCall):
+        """Stop measuring the open phase of a call and aggregate it under the kind of the call."""
+
+        if call.phase is None:
+            return
+
+        cpu = time.thread_time() - call.cpu
+        wall = time.perf_counter() - call.wall
+        net = peak = 0
+
+        if call.traced:
+            current, peak = tracemalloc.get_traced_memory()
+            net, peak = current - call.memory, max(0, peak - call.memory)
+
+        key = (call.kind, call.phase)
+        call.phase = None
+
+        with self._lock:
+            stats = self._stats.get(key)
+
+            if stats is None:
+                stats = self._stats[key] = FlightProfileStats(kind=key[0], phase=key[1])
+
+            stats.samples += 1
+            stats.cpu += cpu
+            stats.wall += wall
+
+            if call.traced:
+                stats.traced += 1
+                stats.alloc_net += net
+                stats.alloc_peak += peak
+                stats.alloc_peak_max = max(stats.alloc_peak_max, peak)
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: projection.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import json
+import re
+from json.decoder import scanstring
+from typing import Any, Dict, Iterable, Union
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+SKIP_STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"', re.S)
+SKIP_SCALAR = re.compile(r"[^,}\]\s]*")
+
+ProjectionTree = Dict[str, Union["ProjectionTree", bool]]
+
+
+def compile_projection(paths: Iterable[str]) -> ProjectionTree:
+    """Build a projection tree from dotted paths such as "data.price" or "data.itineraries.segments".
+
+    Lists are transparent: a path applies to every element of the lists it crosses. A path keeps its whole
+    subtree, and a shorter path wins over a longer one sharing its prefix.
+    """
+
+    tree: ProjectionTree = {}
+
+    for path in paths:
+        node = tree
+        keys = path.split(".")
+
+        for key in keys[:-1]:
+            child = node.get(key)
+
+            if child is True:
+                break
+
+            node = node.setdefault(key, {})
+        else:
+            node[keys[-1]] = True
+
+    return tree
+
+
+class ProjectionDecoder:
+    """JSON decoder that only materializes the projected paths.
+
+    Kept values are decoded with the C-accelerated json scanner. Skipped strings and scalars are stepped over
+    without decoding; skipped containers go through the same C scanner and are dropped at once, which is faster
+    than walking them in Python. Discarded subtrees are therefore never assembled into the result, and peak
+    memory is bounded by the largest single skipped subtree instead of the whole document.
+    """
+
+    def __init__(self, paths: Iterable[str]):
+        """Initialize the decoder for the given dotted paths."""
+
+        self.tree = compile_projection(paths)
+        self._scan_once = json.JSONDecoder().scan_once
+
+    def decode(self, document: Union[str, bytes]) -> Any:
+        """Decode a JSON document keeping only the projected paths."""
+
+        if isinstance(document, (bytes, bytearray)):
+            document = document.decode("utf-8")
+
+        value, end = self._value(document, WHITESPACE.match(document, 0).end(), self.tree)
+
+        if WHITESPACE.match(document, end).end() != len(document):
+            raise json.JSONDecodeError("Extra data", document, end)
+
+        return value
+
+    def _value(self, s: str, idx: int, tree: Union[ProjectionTree, bool]):
+        """Decode the value at idx following the projection tree; returns (value, end)."""
+
+        char = s[idx:idx + 1]
+
+        if tree is True or char not in ("{", "["):
+            try:
+                return self._scan_once(s, idx)
+            except StopIteration:
+                raise json.JSONDecodeError("Expecting value", s, idx) from None
+
+        if char == "[":
+            return self._array(s, idx + 1, tree)
+
+        return self._object(s, idx + 1, tree)
+
+    def _array(self, s: str, idx: int, tree: ProjectionTree):
+        """Decode an array whose elements all follow the same projection tree."""
+
+        values = []
+        idx = WHITESPACE.match(s, idx).end()
+
+        if s[idx:idx + 1] == "]":
+            return values, idx + 1
+
+        while True:
+            value, idx = self._value(s, idx, tree)
+            values.append(value)
+            idx = WHITESPACE.match(s, idx).end()
+            char = s[idx:idx + 1]
+
+            if char == "]":
+                return values, idx + 1
+
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", s, idx)
+
+            idx = WHITESPACE.match(s, idx + 1).end()
+
+    def _object(self, s: str, idx: int, tree: ProjectionTree):
+        """Decode the projected members of an object and skip the others."""
+
+        values = {}
+        idx = WHITESPACE.match(s, idx).end()
+
+        if s[idx:idx + 1] == "}":
+            return values, idx + 1
+
+        while True:
+            if s[idx:idx + 1] != '"':
+                raise json.JSONDecodeError("Expecting property name enclosed in double quotes", s, idx)
+
+            key, idx = scanstring(s, idx + 1)
+            idx = WHITESPACE.match(s, idx).end()
+
+            if s[idx:idx + 1] != ":":
+                raise json.JSONDecodeError("Expecting ':' delimiter", s, idx)
+
+            idx = WHITESPACE.match(s, idx + 1).end()
+            subtree = tree.get(key)
+
+            if subtree is None:
+                idx = self._skip(s, idx)
+            else:
+                values[key], idx = self._value(s, idx, subtree)
+
+            idx = WHITESPACE.match(s, idx).end()
+            char = s[idx:idx + 1]
+
+            if char == "}":
+                return values, idx + 1
+
+            if char != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", s, idx)
+
+            idx = WHITESPACE.match(s, idx + 1).end()
+
+    def _skip(self, s: str, idx: int) -> int:
+        """Return the end index of the value at idx, discarding it."""
+
+        char = s[idx:idx + 1]
+
+        if char == '"':
+            match = SKIP_STRING.match(s, idx)
+
+            if match is None:
+                raise json.JSONDecodeError("Unterminated string", s, idx)
+
+            return match.end()
+
+        if char not in ("{", "["):
+            return SKIP_SCALAR.match(s, idx).end()
+
+        try:
+            return self._scan_once(s, idx)[1]
+        except StopIteration:
+            raise json.JSONDecodeError("Expecting value", s, idx) from None
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: queues.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional, Set, Iterator
+
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import FlightQueueDiff
+
+logger = logging.getLogger(__name__)
+
+
+def queue_entry_key(entry: Any) -> Optional[str]:
+    """Return the record locator of a queue entry, falling back to its id."""
+
+    for field in ("reference", "recordLocator"):
+        if entry.get(field):
+            return entry[field]
+
+    for record in entry.get("associatedRecords", []):
+        if record.get("reference"):
+            return record["reference"]
+
+    return entry.get("id") or None
+
+
+class FlightQueueWatcher:
+    """Poll a queue, diff it against the last persisted snapshot and only emit added and removed entries.
+
+    New entries are retrieved by locator on the SDK bulk retrieval pool while the queue pages are still being
+    read, so neither the queue nor the retrieved orders are ever held in memory as a whole.
+    """
+
+    def __init__(
+            self,
+            sdk: Any,
+            *,
+            queue: str,
+            category: str,
+            snapshot_path: Optional[str] = None,
+            interval: float = 60.0,
+            page_size: Optional[int] = None,
+            key: Callable[[Any], Optional[str]] = queue_entry_key,
+            retrieve_added: bool = True,
+            max_workers: int = 4,
+            on_added: Optional[Callable] = None,
+            on_removed: Optional[Callable] = None,
+            on_complete: Optional[Callable] = None
+    ):
+        """Initialize the watcher for a queue and category of the given FlightSDK."""
+
+        self.sdk = sdk
+        self.queue = queue
+        self.category = category
+        self.snapshot_path = snapshot_path
+        self.interval = interval
+        self.page_size = page_size
+        self.key = key
+        self.retrieve_added = retrieve_added
+        self.max_workers = max_workers
+        self.on_added = on_added
+        self.on_removed = on_removed
+        self.on_complete = on_complete
+        self.snapshot: Optional[Set[str]] = None
+
+    def load_snapshot(self) -> Set[str]:
+        """Return the keys seen on the last poll, reading them from the snapshot file on first use."""
+
+        if self.snapshot is None:
+            self.snapshot = set()
+
+            if self.snapshot_path and os.path.exists(self.snapshot_path):
+                with open(self.snapshot_path, "r", encoding="utf-8") as snapshot_file:
+                    self.snapshot = set(json.load(snapshot_file).get("keys", []))
+
+        return self.snapshot
+
+    def save_snapshot(self, keys: Set[str]):
+        """Replace the snapshot with the given keys, atomically rewriting the snapshot file if configured."""
+
+        self.snapshot = keys
+
+        if not self.snapshot_path:
+            return
+
+        tmp_path = f"{self.snapshot_path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as snapshot_file:
+            json.dump({
+                "queue": self.queue,
+                "category": self.category,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "keys": sorted(keys),
+            }, snapshot_file)
+
+        os.replace(tmp_path, self.snapshot_path)
+
+    def poll(self) -> FlightQueueDiff:
+        """Read the queue once, emit the added and removed entries and persist the new snapshot."""
+
+        previous = self.load_snapshot()
+        current = set()
+        pending = {}
+        added = []
+
+        def new_entries() -> Iterator[str]:
+            for entry in self.sdk.iter_queue_list(queue=self.queue, category=self.category,
+                                                  page_size=self.page_size, on_complete=self.on_complete):
+                entry_key = self.key(entry)
+
+                if entry_key is None or entry_key in current:
+                    continue
+
+                current.add(entry_key)
+
+                if entry_key not in previous:
+                    pending[entry_key] = entry
+                    yield entry_key
+
+        if self.retrieve_added:
+            results = self.sdk.bulk_retrieve(locators=new_entries(), max_workers=self.max_workers,
+                                             on_complete=self.on_complete)
+        else:
+            results = ((entry_key, None, None) for entry_key in new_entries())
+
+        with self.sdk.shared_token(on_complete=self.on_complete):
+            for entry_key, status, data in results:
+                added.append(entry_key)
+
+                if self.on_added:
+                    self.on_added(key=entry_key, entry=pending.pop(entry_key), status=status, data=data)
+                else:
+                    pending.pop(entry_key)
+
+        removed = sorted(previous - current)
+
+        if self.on_removed:
+            for entry_key in removed:
+                self.on_removed(key=entry_key)
+
+        self.save_snapshot(current)
+
+        return FlightQueueDiff(queue=self.queue, category=self.category, total=len(current), added=sorted(added),
+                               removed=removed)
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """Poll the queue every interval seconds until the stop event is set."""
+
+        stop_event = stop_event or threading.Event()
+
+        while not stop_event.is_set():
+            try:
+                diff = self.poll()
+                logger.info("Queue %s/%s: %s entries, %s added, %s removed", self.queue, self.category, diff.total,
+                            len(diff.added), len(diff.removed))
+            except Exception:
+                logger.exception("Queue %s/%s poll failed", self.queue, self.category)
+
+            stop_event.wait(self.interval)
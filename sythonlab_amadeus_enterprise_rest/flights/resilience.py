@@ -0,0 +1,397 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: resilience.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor, FIRST_COMPLETED, wait
+from typing import Callable, Dict, Iterable, Optional, Any, Tuple
+
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind, FlightCircuitState
+from sythonlab_amadeus_enterprise_rest.flights.exceptions import FlightCircuitOpenError
+
+# Kinds that only read upstream state and can safely be sent more than once.
+IDEMPOTENT_KINDS = frozenset({
+    FlightResultKind.FLIGHT_SEARCH,
+    FlightResultKind.FLIGHT_AVAILABILITIES,
+    FlightResultKind.FLIGHT_PRICING,
+    FlightResultKind.FLIGHT_BRANDED_FARE_UPSELL,
+    FlightResultKind.FLIGHT_RETRIEVE_BY_ID,
+    FlightResultKind.FLIGHT_RETRIEVE_BY_PNR,
+    FlightResultKind.FLIGHT_QUEUE_LIST,
+})
+
+
+class HedgingPolicy:
+    """Opt-in request hedging for idempotent kinds.
+
+    When a request has not answered within the configured latency percentile of its kind, a duplicate is sent
+    and the first response wins. Duplicates are limited to max_extra_ratio of the hedged traffic. Requests run on a
+    pool of max_workers threads and are never queued there: when every thread is busy, the request is sent unhedged
+    on the calling thread, and a duplicate is not sent. Latencies are measured from the moment a request starts.
+    """
+
+    def __init__(
+            self,
+            *,
+            kinds: Iterable[FlightResultKind] = (
+                    FlightResultKind.FLIGHT_SEARCH,
+                    FlightResultKind.FLIGHT_AVAILABILITIES,
+                    FlightResultKind.FLIGHT_RETRIEVE_BY_ID,
+                    FlightResultKind.FLIGHT_RETRIEVE_BY_PNR,
+            ),
+            percentile: float = 0.95,
+            initial_delay: float = 1.0,
+            min_delay: float = 0.05,
+            max_delay: Optional[float] = None,
+            window: int = 200,
+            min_samples: int = 20,
+            max_extra_ratio: float = 0.1,
+            max_workers: int = 16
+    ):
+        """Initialize the policy; raises ValueError if a non-idempotent kind is requested."""
+
+        kinds = frozenset(kinds)
+
+        if not kinds <= IDEMPOTENT_KINDS:
+            invalid = sorted(kind.value for kind in kinds - IDEMPOTENT_KINDS)
+            raise ValueError(f"Only idempotent kinds can be hedged: {invalid}")
+
+        self.kinds = kinds
+        self.percentile = percentile
+        self.initial_delay = initial_delay
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.min_samples = min_samples
+        self.max_extra_ratio = max_extra_ratio
+        self._latencies: Dict[FlightResultKind, deque] = {kind: deque(maxlen=window) for kind in kinds}
+        self._stats: Dict[FlightResultKind, Dict[str, int]] = {
+            kind: {"requests": 0, "hedges_sent": 0, "hedges_won": 0, "budget_exhausted": 0, "pool_exhausted": 0}
+            for kind in kinds
+        }
+        self._budget = 1.0
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(max_workers)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="flight-hedge")
+
+    def applies(self, kind: Optional[FlightResultKind]) -> bool:
+        """Check whether requests of the kind are hedged."""
+
+        return kind in self.kinds
+
+    def delay(self, kind: FlightResultKind) -> float:
+        """Return the current hedging delay of a kind: the configured percentile of its recent latencies."""
+
+        with self._lock:
+            samples = sorted(self._latencies[kind])
+
+        if len(samples) < self.min_samples:
+            return self.initial_delay
+
+        value = max(self.min_delay, samples[min(len(samples) - 1, int(len(samples) * self.percentile))])
+
+        return min(value, self.max_delay) if self.max_delay is not None else value
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        """Return per-kind counters, the hedge win rate and the current delay."""
+
+        with self._lock:
+            stats = {kind: dict(values) for kind, values in self._stats.items()}
+
+        for kind, values in stats.items():
+            values["win_rate"] = values["hedges_won"] / values["hedges_sent"] if values["hedges_sent"] else 0.0
+            values["delay"] = self.delay(kind)
+
+        return {kind.value: values for kind, values in stats.items()}
+
+    def execute(self, kind: FlightResultKind, send: Callable[[], Any],
+                hedge: Optional[Callable[[], Any]] = None) -> Any:
+        """Run send, hedging it with a duplicate if it is slower than the kind delay, and return the first result.
+
+        The duplicate is sent with hedge (send by default), which may return None when it cannot be sent, e.g. for
+        lack of a free slot; the primary result is then awaited.
+        """
+
+        delay = self.delay(kind)
+
+        with self._lock:
+            self._stats[kind]["requests"] += 1
+            self._budget = min(1.0 + self.max_extra_ratio * 10, self._budget + self.max_extra_ratio)
+
+        submitted = self._submit(kind, send)
+
+        if submitted is None:
+            with self._lock:
+                self._stats[kind]["pool_exhausted"] += 1
+
+            return self._run(kind, send)
+
+        primary, started = submitted
+        started.wait()
+        done, _ = wait([primary], timeout=delay)
+
+        if done:
+            return primary.result()
+
+        with self._lock:
+            allowed = self._budget >= 1.0
+
+            if allowed:
+                self._budget -= 1.0
+            else:
+                self._stats[kind]["budget_exhausted"] += 1
+
+        if not allowed:
+            return primary.result()
+
+        submitted = self._submit(kind, hedge or send)
+
+        with self._lock:
+            if submitted is None:
+                self._budget += 1.0
+                self._stats[kind]["pool_exhausted"] += 1
+            else:
+                self._stats[kind]["hedges_sent"] += 1
+
+        if submitted is None:
+            return primary.result()
+
+        duplicate = submitted[0]
+        pending = {primary, duplicate}
+
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            winner = next((future for future in done if future.exception() is None and future.result() is not None),
+                          None)
+
+            if winner is None:
+                continue
+
+            if winner is duplicate:
+                with self._lock:
+                    self._stats[kind]["hedges_won"] += 1
+
+            for loser in pending:
+                loser.add_done_callback(self._discard)
+
+            return winner.result()
+
+        return primary.result()
+
+    def shutdown(self):
+        """Stop the hedging thread pool."""
+
+        self._executor.shutdown(wait=False)
+
+    def _submit(self, kind: FlightResultKind, send: Callable[[], Any]) -> Optional[Tuple[Future, threading.Event]]:
+        """Run send on a free pool thread and return its future and started event, or None if every thread is busy."""
+
+        if not self._slots.acquire(blocking=False):
+            return None
+
+        started = threading.Event()
+
+        def run():
+            try:
+                started.set()
+                return self._run(kind, send)
+            finally:
+                self._slots.release()
+
+        try:
+            return self._executor.submit(run), started
+        except BaseException:
+            self._slots.release()
+            raise
+
+    def _run(self, kind: FlightResultKind, send: Callable[[], Any]) -> Any:
+        """Run send on the calling thread, recording its latency if it returns a response."""
+
+        start = time.monotonic()
+        result = send()
+
+        if result is not None:
+            with self._lock:
+                self._latencies[kind].append(time.monotonic() - start)
+
+        return result
+
+    @staticmethod
+    def _discard(future):
+        """Release the connection of a losing response once it arrives."""
+
+        if not future.cancelled() and future.exception() is None:
+            close = getattr(future.result(), "close", None)
+
+            if close:
+                close()
+
+
+class FlightCircuitBreaker:
+    """Per-kind circuit breaker that fails fast while an endpoint is degraded.
+
+    A circuit opens when, over the last window calls, the error rate (exceptions, 429 and 5xx) or the share of
+    calls slower than latency_threshold exceeds its limit. While open, calls raise FlightCircuitOpenError without
+    touching the network. After open_seconds, up to half_open_max_calls probes are let through: if they all succeed
+    the circuit closes, otherwise it opens again.
+    """
+
+    def __init__(
+            self,
+            *,
+            failure_rate: float = 0.5,
+            latency_threshold: Optional[float] = None,
+            slow_rate: float = 0.5,
+            window: int = 50,
+            min_calls: int = 10,
+            open_seconds: float = 30.0,
+            half_open_max_calls: int = 3,
+            on_state_change: Optional[Callable[[Any, FlightCircuitState, FlightCircuitState], None]] = None
+    ):
+        """Initialize the breaker thresholds and the optional on_state_change(key, old, new) callback."""
+
+        self.failure_rate = failure_rate
+        self.latency_threshold = latency_threshold
+        self.slow_rate = slow_rate
+        self.window = window
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.on_state_change = on_state_change
+        self._circuits: Dict[Any, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def is_failure(status: Optional[int]) -> bool:
+        """Check whether a response status counts as an endpoint failure."""
+
+        return status is None or status == 429 or status >= 500
+
+    def state(self, key: Any) -> FlightCircuitState:
+        """Return the current state of the circuit for a key."""
+
+        with self._lock:
+            return self._circuit(key)["state"]
+
+    def states(self) -> Dict[Any, FlightCircuitState]:
+        """Return the current state of every known circuit."""
+
+        with self._lock:
+            return {key: circuit["state"] for key, circuit in self._circuits.items()}
+
+    def check(self, key: Any):
+        """Raise FlightCircuitOpenError if a call for the key would be rejected now, without admitting it."""
+
+        with self._lock:
+            circuit = self._circuits.get(key)
+
+            if circuit is None:
+                return
+
+            if circuit["state"] == FlightCircuitState.OPEN:
+                remaining = circuit["opened_until"] - time.monotonic()
+
+                if remaining > 0:
+                    raise FlightCircuitOpenError(key, retry_after=remaining)
+            elif circuit["state"] == FlightCircuitState.HALF_OPEN and circuit["probes"] >= self.half_open_max_calls:
+                raise FlightCircuitOpenError(key)
+
+    def before(self, key: Any):
+        """Admit a call for the key or raise FlightCircuitOpenError."""
+
+        with self._lock:
+            circuit = self._circuit(key)
+            changes = []
+
+            if circuit["state"] == FlightCircuitState.OPEN:
+                remaining = circuit["opened_until"] - time.monotonic()
+
+                if remaining > 0:
+                    raise FlightCircuitOpenError(key, retry_after=remaining)
+
+                changes.append(self._transition(key, circuit, FlightCircuitState.HALF_OPEN))
+
+            if circuit["state"] == FlightCircuitState.HALF_OPEN:
+                if circuit["probes"] >= self.half_open_max_calls:
+                    raise FlightCircuitOpenError(key)
+
+                circuit["probes"] += 1
+
+        self._notify(changes)
+
+    def after(self, key: Any, *, status: Optional[int], latency: float):
+        """Record the outcome of an admitted call; status is None when the call raised."""
+
+        failed = self.is_failure(status)
+        slow = self.latency_threshold is not None and latency > self.latency_threshold
+
+        with self._lock:
+            circuit = self._circuit(key)
+            changes = []
+
+            if circuit["state"] == FlightCircuitState.HALF_OPEN:
+                if failed or slow:
+                    changes.append(self._open(key, circuit))
+                else:
+                    circuit["successes"] += 1
+
+                    if circuit["successes"] >= self.half_open_max_calls:
+                        changes.append(self._transition(key, circuit, FlightCircuitState.CLOSED))
+            elif circuit["state"] == FlightCircuitState.CLOSED:
+                outcomes = circuit["outcomes"]
+                outcomes.append((failed, slow))
+
+                if len(outcomes) >= self.min_calls:
+                    failures = sum(1 for outcome in outcomes if outcome[0])
+                    slows = sum(1 for outcome in outcomes if outcome[1])
+
+                    if failures / len(outcomes) >= self.failure_rate or slows / len(outcomes) >= self.slow_rate:
+                        changes.append(self._open(key, circuit))
+
+        self._notify(changes)
+
+    def _circuit(self, key: Any) -> Dict[str, Any]:
+        """Return the circuit of a key, creating it closed. The lock must be held."""
+
+        circuit = self._circuits.get(key)
+
+        if circuit is None:
+            circuit = self._circuits[key] = {
+                "state": FlightCircuitState.CLOSED,
+                "outcomes": deque(maxlen=self.window),
+                "opened_until": 0.0,
+                "probes": 0,
+                "successes": 0,
+            }
+
+        return circuit
+
+    def _open(self, key: Any, circuit: Dict[str, Any]):
+        """Open a circuit for open_seconds. The lock must be held."""
+
+        circuit["opened_until"] = time.monotonic() + self.open_seconds
+        return self._transition(key, circuit, FlightCircuitState.OPEN)
+
+    @staticmethod
+    def _transition(key: Any, circuit: Dict[str, Any], state: FlightCircuitState):
+        """Move a circuit to a new state, resetting its counters. The lock must be held."""
+
+        old = circuit["state"]
+        circuit["state"] = state
+        circuit["outcomes"].clear()
+        circuit["probes"] = 0
+        circuit["successes"] = 0
+
+        return key, old, state
+
+    def _notify(self, changes):
+        """Call on_state_change for the given transitions, outside the lock."""
+
+        if self.on_state_change:
+            for key, old, new in changes:
+                self.on_state_change(key, old, new)
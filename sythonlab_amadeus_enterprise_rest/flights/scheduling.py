@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: scheduling.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import asyncio
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager, asynccontextmanager
+from typing import Callable, Dict, Optional
+
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightEndpointGroup, FlightResultKind
+
+DEFAULT_WEIGHTS = {
+    FlightEndpointGroup.AUTH: 16,
+    FlightEndpointGroup.BOOKING: 8,
+    FlightEndpointGroup.PRICING: 4,
+    FlightEndpointGroup.SHOPPING: 1,
+}
+
+
+class _Waiter:
+    """A queued request for a slot, granted either to a thread or to an asyncio future."""
+
+    __slots__ = ("group", "enqueued_at", "grant", "granted")
+
+    def __init__(self, group: FlightEndpointGroup, grant: Callable[[], None]):
+        self.group = group
+        self.enqueued_at = time.monotonic()
+        self.grant = grant
+        self.granted = False
+
+
+class PriorityScheduler:
+    """Weighted fair queuing of SDK requests over a fixed number of concurrent slots.
+
+    Free slots are handed out by weight per endpoint group (booking > pricing > shopping by default, with logins
+    first since every operation needs one), so a burst of searches cannot delay reservations and issuances.
+    A waiter queued longer than max_wait seconds is served next whatever its class, so shopping never starves.
+    Threads use acquire/release or slot(); asyncio callers use acquire_async or slot_async.
+    """
+
+    def __init__(
+            self,
+            *,
+            capacity: int = 16,
+            weights: Optional[Dict[FlightEndpointGroup, float]] = None,
+            max_wait: float = 5.0
+    ):
+        """Initialize the scheduler with the number of concurrent slots and the per-group weights."""
+
+        self.capacity = capacity
+        self.weights = {**DEFAULT_WEIGHTS, **(weights or {})}
+        self.max_wait = max_wait
+        self.in_use = 0
+        self._queues: Dict[FlightEndpointGroup, deque] = {group: deque() for group in FlightEndpointGroup}
+        self._finish: Dict[FlightEndpointGroup, float] = {group: 0.0 for group in FlightEndpointGroup}
+        self._clock = 0.0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def group_of(kind: Optional[FlightResultKind]) -> FlightEndpointGroup:
+        """Return the priority class of a kind of request."""
+
+        return FlightEndpointGroup.of(kind)
+
+    def queued(self) -> Dict[str, int]:
+        """Return the number of waiters per priority class."""
+
+        with self._lock:
+            return {group.value: len(queue) for group, queue in self._queues.items()}
+
+    def acquire(self, group: FlightEndpointGroup, timeout: Optional[float] = None) -> bool:
+        """Block until a slot is granted to the group; returns False if the timeout expires first."""
+
+        event = threading.Event()
+
+        with self._lock:
+            waiter = self._enqueue(group, event.set)
+
+            if waiter is None:
+                return True
+
+        if event.wait(timeout):
+            return True
+
+        with self._lock:
+            if waiter.granted:
+                return True
+
+            self._queues[group].remove(waiter)
+            return False
+
+    async def acquire_async(self, group: FlightEndpointGroup):
+        """Wait without blocking the event loop until a slot is granted to the group."""
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+
+        def grant():
+            loop.call_soon_threadsafe(lambda: future.done() or future.set_result(True))
+
+        with self._lock:
+            waiter = self._enqueue(group, grant)
+
+            if waiter is None:
+                return
+
+        try:
+            await future
+        except asyncio.CancelledError:
+            with self._lock:
+                if not waiter.granted:
+                    self._queues[group].remove(waiter)
+                    raise
+
+            self.release()
+            raise
+
+    def release(self):
+        """Free a slot and hand it to the next waiter."""
+
+        with self._lock:
+            self.in_use -= 1
+            self._dispatch()
+
+    @contextmanager
+    def slot(self, group: FlightEndpointGroup):
+        """Hold a slot for the group for the duration of the block."""
+
+        self.acquire(group)
+
+        try:
+            yield
+        finally:
+            self.release()
+
+    @asynccontextmanager
+    async def slot_async(self, group: FlightEndpointGroup):
+        """Hold a slot for the group for the duration of the async block."""
+
+        await self.acquire_async(group)
+
+        try:
+            yield
+        finally:
+            self.release()
+
+    def _enqueue(self, group: FlightEndpointGroup, grant: Callable[[], None]) -> Optional[_Waiter]:
+        """Take a free slot right away, or queue a waiter and return it. The lock must be held."""
+
+        if self.in_use < self.capacity and not any(self._queues.values()):
+            self.in_use += 1
+            self._charge(group)
+            return None
+
+        waiter = _Waiter(group, grant)
+        self._queues[group].append(waiter)
+        self._dispatch()
+
+        return waiter
+
+    def _dispatch(self):
+        """Grant free slots to waiters, oldest-overdue first, then by weighted fair order. The lock must be held."""
+
+        while self.in_use < self.capacity:
+            heads = [queue[0] for queue in self._queues.values() if queue]
+
+            if not heads:
+                return
+
+            oldest = min(heads, key=lambda waiter: waiter.enqueued_at)
+
+            if time.monotonic() - oldest.enqueued_at >= self.max_wait:
+                waiter = oldest
+            else:
+                waiter = min(heads, key=lambda head: max(self._clock, self._finish[head.group])
+                             + 1 / self.weights[head.group])
+
+            self._queues[waiter.group].popleft()
+            self.in_use += 1
+            self._charge(waiter.group)
+            waiter.granted = True
+            waiter.grant()
+
+    def _charge(self, group: FlightEndpointGroup):
+        """Advance the virtual clock and the finish tag of a group by one request. The lock must be held."""
+
+        start = max(self._clock, self._finish[group])
+        self._finish[group] = start + 1 / self.weights[group]
+        self._clock = start
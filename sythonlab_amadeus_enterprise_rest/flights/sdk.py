@@ -6,42 +6,112 @@ Author: Sython Lab (sythonlab@gmail.com)
 Created: 2025-12-04
 """
 
+import copy
+import json
 import logging
+import socket
+import threading
+import time
+from contextlib import contextmanager, nullcontext
 from datetime import datetime, timezone
-from typing import List, Any, Optional, Callable
+from typing import List, Any, Optional, Callable, Iterable, Iterator, Tuple
+from urllib.parse import urlsplit
 from uuid import uuid4
 
-import requests
-
 from sythonlab_amadeus_enterprise_rest import settings
 from sythonlab_amadeus_enterprise_rest.core.enums import Currency, TravelerType, PaymentMethod, RequestMethod, \
     CommissionType, CardBrand
+from sythonlab_amadeus_enterprise_rest.flights.cache import FlightResultCache
+from sythonlab_amadeus_enterprise_rest.flights.capture import RequestCapture, SECRET_KINDS, redact
+from sythonlab_amadeus_enterprise_rest.flights.concurrency import bounded_map, call_with_retries
 from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax, \
-    ReservePax, PaymentData, FlightRequestMetadata, FlightReserveQueueData
-from sythonlab_amadeus_enterprise_rest.flights.endpoints import FlightEndpoints
-from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind
+    ReservePax, PaymentData, FlightRequestMetadata, FlightReserveQueueData, SearchOptions, \
+    CompactFlightRequestMetadata, FlightRawResponse, FlightWarmUp, FlightUpsellResults
+from sythonlab_amadeus_enterprise_rest.flights.endpoints import FlightEndpoints, FLIGHT_URL_BASE
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind, FlightEndpointGroup, FlightPassthrough, \
+    FlightProfilePhase
+from sythonlab_amadeus_enterprise_rest.flights.fingerprints import offer_fingerprint, segments_fingerprint
+from sythonlab_amadeus_enterprise_rest.flights.limits import AdaptiveLimiter
+from sythonlab_amadeus_enterprise_rest.flights.offers import brand_options
+from sythonlab_amadeus_enterprise_rest.flights.offload import DecodeOffload, decode_body
+from sythonlab_amadeus_enterprise_rest.flights.profiling import FlightProfiler, profiled
+from sythonlab_amadeus_enterprise_rest.flights.resilience import HedgingPolicy, FlightCircuitBreaker
+from sythonlab_amadeus_enterprise_rest.flights.scheduling import PriorityScheduler
+from sythonlab_amadeus_enterprise_rest.flights.store import FlightOrderStore
+from sythonlab_amadeus_enterprise_rest.flights.transports import FlightTransport, RequestsTransport, TRANSPORT_ERRORS, \
+    encode_body
+from sythonlab_amadeus_enterprise_rest.flights.validation import OfferValidator
 
 logger = logging.getLogger(__name__)
 
 
 class FlightSDK:
-    """SDK for interacting with Amadeus Enterprise REST Flight APIs."""
+    """SDK for interacting with Amadeus Enterprise REST Flight APIs.
+
+    An instance is safe to share between threads: the token and its expiry are swapped atomically, concurrent
+    logins are coalesced into one and every call builds its own headers and ama-client-ref.
+    """
 
     ama_ref = None
     prefix_ama_ref = ""
     suffix_ama_ref = ""
     currency = Currency.USD
-    auth_data = None
     debug = False
+    cache = None
+    store = None
+    hedging = None
+    circuit_breaker = None
+    limiter = None
+    scheduler = None
+    capture = None
+    compact_metadata = False
+    offload = None
+    validator = None
+    profiler = None
+    transport = None
+    shared_token_depth = 0
+    token_margin = 60
+    reuse_token = False
 
     def __init__(self, *, prefix_ama_ref: str = "", suffix_ama_ref: str = "", currency: Currency = Currency.USD,
-                 debug: bool = False, ama_ref: str = None):
-        """Initialize the FlightSDK with optional parameters."""
+                 debug: bool = False, ama_ref: str = None, cache: Optional[FlightResultCache] = None,
+                 store: Optional[FlightOrderStore] = None, hedging: Optional[HedgingPolicy] = None,
+                 circuit_breaker: Optional[FlightCircuitBreaker] = None, limiter: Optional[AdaptiveLimiter] = None,
+                 scheduler: Optional[PriorityScheduler] = None, capture: Optional[RequestCapture] = None,
+                 compact_metadata: bool = False, offload: Optional[DecodeOffload] = None,
+                 validator: Optional[OfferValidator] = None, transport: Optional[FlightTransport] = None,
+                 pool_size: int = 10, reuse_token: bool = False, profiler: Optional[FlightProfiler] = None):
+        """Initialize the FlightSDK with optional parameters.
+
+        Requests go through transport, by default a pooled requests session of pool_size connections per host.
+        With reuse_token, every call reuses the current access token while it is valid, as inside shared_token.
+        With validator, pricing and reserve reject offers known to be stale before any network I/O.
+        With profiler, sampled calls record their CPU time and allocations per phase.
+        """
 
         self.currency = currency
         self.debug = debug
+        self.cache = cache
+        self.store = store
+        self.hedging = hedging
+        self.circuit_breaker = circuit_breaker
+        self.limiter = limiter
+        self.scheduler = scheduler
+        self.capture = capture
+        self.compact_metadata = compact_metadata
+        self.offload = offload
+        self.validator = validator
+        self.profiler = profiler
         self.prefix_ama_ref = prefix_ama_ref
         self.suffix_ama_ref = suffix_ama_ref
+        self.shared_token_depth = 0
+        self.reuse_token = reuse_token
+        self._keep_alive_stop: Optional[threading.Event] = None
+        self._auth = (None, None)
+        self._auth_generation = 0
+        self._auth_lock = threading.Lock()
+        self._depth_lock = threading.Lock()
+        self.transport = transport or RequestsTransport(pool_size=pool_size)
 
     def build_ama_ref(self):
         """Generate a unique ama-client-ref for tracking requests."""
@@ -51,19 +121,60 @@ class FlightSDK:
 
         return f"{self.prefix_ama_ref}/{iso}/{str(uuid4())}/{self.suffix_ama_ref}"
 
+    @property
+    def auth_data(self):
+        """Login response holding the current access token."""
+
+        return self._auth[0]
+
+    @auth_data.setter
+    def auth_data(self, value):
+        """Replace the login response; its expiry becomes unknown."""
+
+        self._auth = (value, None)
+
+    @property
+    def auth_expires_at(self):
+        """Monotonic time at which the current access token expires, if known."""
+
+        return self._auth[1]
+
     @property
     def access_token(self):
         """Retrieve the access token from auth_data if available."""
 
-        if self.auth_data:
-            return self.auth_data.get("access_token")
+        auth_data = self._auth[0]
+
+        if auth_data:
+            return auth_data.get("access_token")
         return None
 
+    @property
+    def token_is_valid(self):
+        """Check whether the current access token exists and is not about to expire."""
+
+        auth_data, expires_at = self._auth
+
+        if not auth_data or not auth_data.get("access_token"):
+            return False
+
+        if expires_at is None:
+            return True
+
+        return time.monotonic() < expires_at - self.token_margin
+
+    def invalidate_token(self):
+        """Drop the current access token so that the next login fetches a new one, e.g. after a 401."""
+
+        self._auth = (None, None)
+
     def build_headers(self, headers: Optional[Any] = None, use_json: bool = True, no_auth: bool = False):
-        """Build request headers, adding Content-Type and Authorization if not provided."""
+        """Build request headers, adding Content-Type and Authorization if not provided.
+
+        The given headers are copied, never modified, so a dict can be shared between calls and threads.
+        """
 
-        if not headers:
-            headers = {}
+        headers = dict(headers or {})
 
         if not headers.get("Content-Type"):
             headers["Content-Type"] = "application/json" if use_json else "application/x-www-form-urlencoded"
@@ -75,6 +186,13 @@ class FlightSDK:
 
         return headers
 
+    def send(self, *, url: str, payload: Any, headers: dict, use_json: bool, method: RequestMethod,
+             stream: bool = False):
+        """Send one HTTP request through the SDK transport and return the raw response."""
+
+        return self.transport.send(method=method, url=url, payload=payload, headers=headers, use_json=use_json,
+                                   stream=stream)
+
     def request(
             self,
             *,
@@ -86,78 +204,250 @@ class FlightSDK:
             no_auth: bool = False,
             show_response: bool = False,
             on_complete: Optional[Callable] = None,
-            kind: Optional[FlightResultKind] = None
+            kind: Optional[FlightResultKind] = None,
+            passthrough: Optional[FlightPassthrough] = None,
+            decoder: Optional[Callable[[bytes], Any]] = None
     ):
-        """Make an HTTP request to the specified URL with the given payload and headers."""
+        """Make an HTTP request to the specified URL with the given payload and headers.
+
+        decoder, if given, replaces response.json() to decode the response body.
+        With passthrough, the body is returned undecoded as a FlightRawResponse instead of parsed JSON.
+        Raises FlightCircuitOpenError without sending anything while the circuit breaker of the kind is open.
+        JSON bodies are encoded here, so the transport receives them as bytes and the profiler can time the encoding.
+        """
+
+        profiler = self.profiler
+
+        with profiler.request(kind) if profiler is not None else nullcontext():
+            headers = self.build_headers(headers, use_json=use_json, no_auth=no_auth)
+
+            if not payload:
+                payload = {}
+
+            body = payload
 
-        headers = self.build_headers(headers, use_json=use_json, no_auth=no_auth)
+            if method == RequestMethod.PATCH or (use_json and method == RequestMethod.POST):
+                body, _ = encode_body(payload, use_json=True)
 
-        if not payload:
-            payload = {}
+            start = datetime.now(timezone.utc)
 
-        start = datetime.now(timezone.utc)
+            if self.debug:
+                logger.debug("-" * 100)
+                logger.debug("URL: %s", url)
+                logger.debug("Start time: %s", start.strftime("%d/%m/%Y %H:%M:%S"))
+                logger.debug("Headers: %s", redact(headers))
+                logger.debug("Payload: %s", redact(payload))
 
-        if self.debug:
-            logger.debug("-" * 100)
-            logger.debug("URL: %s", url)
-            logger.debug("Start time: %s", start.strftime("%d/%m/%Y %H:%M:%S"))
-            logger.debug("Headers: %s", headers)
-            logger.debug("Payload: %s", payload)
+            def send(request_headers: dict = headers):
+                return self.send(url=url, payload=body, headers=request_headers, use_json=use_json, method=method,
+                                 stream=passthrough in (FlightPassthrough.STREAM, FlightPassthrough.COMPRESSED_STREAM))
 
-        if method == RequestMethod.POST:
-            if use_json:
-                response = requests.post(url, json=payload, headers=headers)
+            breaker_key = kind or url
+            group = FlightEndpointGroup.of(kind)
+            hedges = []
+
+            def send_hedge():
+                # The duplicate has its own ama-client-ref and takes its own limiter and scheduler slots; it is not
+                # sent when none is free right away.
+                hedge_headers = {**headers, "ama-client-ref": self.build_ama_ref()}
+
+                if self.scheduler is not None and not self.scheduler.acquire(group, timeout=0):
+                    return None
+
+                if self.limiter is not None and not self.limiter.acquire(group, timeout=0):
+                    if self.scheduler is not None:
+                        self.scheduler.release()
+                    return None
+
+                hedge_sent_at = time.monotonic()
+                hedge_status = None
+
+                try:
+                    hedge_response = send(hedge_headers)
+                    hedge_status = hedge_response.status_code
+                    hedges.append((hedge_response, hedge_headers))
+                    return hedge_response
+                finally:
+                    if self.scheduler is not None:
+                        self.scheduler.release()
+
+                    if self.limiter is not None:
+                        self.limiter.release(group, status=hedge_status, latency=time.monotonic() - hedge_sent_at)
+
+            if profiler is not None:
+                profiler.enter(FlightProfilePhase.NETWORK)
+
+            if self.circuit_breaker is not None:
+                self.circuit_breaker.before(breaker_key)
+
+            # The group limiter is waited on first, so a throttled group does not hold a shared scheduler slot.
+            if self.limiter is not None:
+                self.limiter.acquire(group)
+
+            if self.scheduler is not None:
+                self.scheduler.acquire(group)
+
+            sent_at = time.monotonic()
+            response_status = None
+
+            try:
+                if self.hedging is not None and self.hedging.applies(kind):
+                    response = self.hedging.execute(kind, send, hedge=send_hedge)
+                    # Report the ama-client-ref of the request that actually answered.
+                    headers = next((sent for hedged, sent in hedges if hedged is response), headers)
+                else:
+                    response = send()
+
+                response_status = response.status_code
+            finally:
+                latency = time.monotonic() - sent_at
+
+                if self.scheduler is not None:
+                    self.scheduler.release()
+
+                if self.limiter is not None:
+                    self.limiter.release(group, status=response_status, latency=latency)
+
+                if self.circuit_breaker is not None:
+                    self.circuit_breaker.after(breaker_key, status=response_status, latency=latency)
+
+            if profiler is not None:
+                profiler.enter(FlightProfilePhase.DECODE)
+
+            end = None
+
+            if self.debug:
+                end = datetime.now(timezone.utc)
+
+                logger.debug("-" * 100)
+                logger.debug("End time: %s", end.strftime("%d/%m/%Y %H:%M:%S"))
+                logger.debug("Duration: %s", end - start)
+                logger.debug("Response status: %s", response.status_code)
+
+                if show_response and passthrough is None:
+                    try:
+                        logger.debug("Response data: %s", redact(response.json()))
+                    except Exception:
+                        logger.debug("Response raw data: %s", redact(response.text))
+
+            if passthrough is not None:
+                status_code, data = response.status_code, self.build_raw_response(response, passthrough)
+            elif method == RequestMethod.DELETE and response.status_code == 204:
+                status_code, data = response.status_code, {}
+            elif decoder is not None:
+                status_code, data = response.status_code, decoder(response.content)
             else:
-                response = requests.post(url, data=payload, headers=headers)
-        elif method == RequestMethod.PATCH:
-            response = requests.patch(url, json=payload, headers=headers)
-        elif method == RequestMethod.GET:
-            response = requests.get(url, params=payload, headers=headers)
-        elif method == RequestMethod.DELETE:
-            response = requests.delete(url, params=payload, headers=headers)
+                status_code, data = response.status_code, response.json()
+
+            if profiler is not None:
+                profiler.enter(FlightProfilePhase.CALLBACK)
+
+            if self.capture is not None and self.capture.should_sample(kind):
+                captured_at = datetime.now(timezone.utc)
+                # The capture thread builds the record later, so it gets snapshots the caller cannot mutate: the
+                # encoded request body and the response content are immutable bytes, decoded on that thread.
+                captured_headers = dict(headers)
+                captured_request = body if isinstance(body, bytes) else copy.deepcopy(payload)
+                captured_response = response.content if passthrough is None else None
+                self.capture.submit(lambda: {
+                    "kind": kind.value if kind else None,
+                    "method": method.value,
+                    "url": url,
+                    "status": status_code,
+                    "start_time": start.isoformat(),
+                    "duration": (captured_at - start).total_seconds(),
+                    "headers": captured_headers,
+                    "request": json.loads(captured_request) if isinstance(captured_request, bytes)
+                    else captured_request,
+                    "response": json.loads(captured_response) if captured_response else None,
+                })
+
+            if on_complete and self.compact_metadata:
+                if kind in SECRET_KINDS:
+                    raw_request = json.dumps(redact(payload), separators=(",", ":")).encode("utf-8")
+                elif isinstance(body, bytes):
+                    raw_request = body
+                else:
+                    raw_request = json.dumps(payload, separators=(",", ":")).encode("utf-8") if payload else b""
+
+                on_complete(metadata=CompactFlightRequestMetadata(
+                    status=status_code,
+                    ama_client=headers.get("ama-client-ref", None),
+                    kind=kind,
+                    headers={key: value for key, value in headers.items() if key != "Authorization"},
+                    raw_request=raw_request,
+                    raw_response=response.content if passthrough in (None, FlightPassthrough.BYTES) else b"",
+                    method=method,
+                    url=url,
+                    start_time=start,
+                    end_time=end,
+                    duration=(end - start).total_seconds() if end else None,
+                ))
+            elif on_complete:
+                on_complete(metadata=FlightRequestMetadata(
+                    status=status_code,
+                    ama_client=headers.get("ama-client-ref", None),
+                    kind=kind,
+                    headers=headers,
+                    request=payload,
+                    method=method,
+                    url=url,
+                    response=data,
+                    start_time=start,
+                    end_time=end,
+                    duration=(end - start).total_seconds() if end else None,
+                ))
+
+            return status_code, data
+
+    @staticmethod
+    def build_raw_response(response: Any, passthrough: FlightPassthrough, chunk_size: int = 64 * 1024):
+        """Wrap an HTTP response as a FlightRawResponse without decoding its JSON body."""
+
+        if passthrough == FlightPassthrough.BYTES:
+            body = response.content
+        elif passthrough == FlightPassthrough.STREAM:
+            body = response.iter_content(chunk_size=chunk_size)
         else:
-            raise ValueError("Unsupported request method")
+            body = response.raw.stream(chunk_size, decode_content=False)
+
+        return FlightRawResponse(
+            status=response.status_code,
+            headers=dict(response.headers),
+            mode=passthrough,
+            body=body,
+            content_encoding=response.headers.get("Content-Encoding")
+            if passthrough == FlightPassthrough.COMPRESSED_STREAM else None,
+            release=response.close
+        )
 
-        end = None
+    def check_circuit(self, kind: FlightResultKind):
+        """Raise FlightCircuitOpenError if the circuit breaker would reject a call of the kind, before any login."""
 
-        if self.debug:
-            end = datetime.now(timezone.utc)
+        if self.circuit_breaker is not None:
+            self.circuit_breaker.check(kind)
 
-            logger.debug("-" * 100)
-            logger.debug("End time: %s", end.strftime("%d/%m/%Y %H:%M:%S"))
-            logger.debug("Duration: %s", end - start)
-            logger.debug("Response status: %s", response.status_code)
+    def login(self, *, on_complete: Optional[Callable] = None, force: bool = False):
+        """Authenticate and obtain an access token.
 
-            if show_response:
-                try:
-                    logger.debug("Response data: %s", response.json())
-                except Exception:
-                    logger.debug("Response raw data: %s", response.text)
+        Inside a shared_token block, or always with reuse_token, the current token is reused while it is still valid,
+        unless force is set. Threads calling login at the same time share a single login: the ones that waited reuse
+        the token it obtained.
+        """
 
-        if method == RequestMethod.DELETE and response.status_code == 204:
-            status_code, data = response.status_code, {}
-        else:
-            status_code, data = response.status_code, response.json()
-
-        if on_complete:
-            on_complete(metadata=FlightRequestMetadata(
-                status=status_code,
-                ama_client=headers.get("ama-client-ref", None),
-                kind=kind,
-                headers=headers,
-                request=payload,
-                method=method,
-                url=url,
-                response=data,
-                start_time=start,
-                end_time=end,
-                duration=(end - start).total_seconds() if end else None,
-            ))
+        if not force and (self.shared_token_depth or self.reuse_token) and self.token_is_valid:
+            return
+
+        generation = self._auth_generation
+
+        with self._auth_lock:
+            if self._auth_generation != generation and self.token_is_valid:
+                return
 
-        return status_code, data
+            self._login(on_complete=on_complete)
 
-    def login(self, *, on_complete: Optional[Callable] = None):
-        """Authenticate and obtain an access token."""
+    def _login(self, *, on_complete: Optional[Callable] = None):
+        """Request a new access token and store it. The auth lock must be held."""
 
         payload = {
             "grant_type": "client_credentials",
@@ -175,30 +465,191 @@ class FlightSDK:
         )
 
         if status == 200:
-            self.auth_data = data
+            expires_in = data.get("expires_in")
+            self._auth = (data, time.monotonic() + expires_in if expires_in else None)
+            self._auth_generation += 1
+
+    @contextmanager
+    def shared_token(self, *, on_complete: Optional[Callable] = None):
+        """Log in once and reuse the token for every call made inside the block, refreshing it only on expiry."""
+
+        self.login(on_complete=on_complete)
+
+        with self._depth_lock:
+            self.shared_token_depth += 1
+
+        try:
+            yield self
+        finally:
+            with self._depth_lock:
+                self.shared_token_depth -= 1
+
+    def warm_up(
+            self,
+            *,
+            connections: int = 4,
+            login: bool = True,
+            keep_alive: Optional[float] = None,
+            on_complete: Optional[Callable] = None
+    ) -> FlightWarmUp:
+        """Prepare the SDK to serve its first requests at full speed, e.g. before a worker reports ready.
+
+        Resolves the API host (failing fast on DNS errors and warming the resolver cache), opens up to connections
+        pooled keep-alive connections to it and, with login, acquires an access token; set reuse_token so that
+        later calls use it. With keep_alive, a background thread then touches the pooled connections and renews
+        the token every keep_alive seconds until stop_keep_alive() is called. Connections are opened and kept alive
+        with HEAD requests to the API root, which carry no token and no body.
+        """
+
+        start = time.monotonic()
+        parts = urlsplit(FLIGHT_URL_BASE or "")
+        addresses = []
+
+        if parts.hostname:
+            port = parts.port or (443 if parts.scheme == "https" else 80)
+            addresses = list(dict.fromkeys(
+                info[4][0] for info in socket.getaddrinfo(parts.hostname, port, type=socket.SOCK_STREAM)
+            ))
+
+        opened = self.transport.warm_up(FLIGHT_URL_BASE, connections) if parts.hostname and connections else 0
+
+        if login:
+            self.login(on_complete=on_complete)
+
+        if keep_alive:
+            self.start_keep_alive(interval=keep_alive, connections=connections, login=login)
 
+        return FlightWarmUp(
+            host=parts.hostname,
+            addresses=addresses,
+            connections=opened,
+            token=self.token_is_valid,
+            elapsed=time.monotonic() - start
+        )
+
+    def start_keep_alive(self, *, interval: float, connections: int = 4, login: bool = True):
+        """Start the background thread keeping the pooled connections (and the token, with login) warm."""
+
+        self.stop_keep_alive()
+        stop = self._keep_alive_stop = threading.Event()
+
+        def run():
+            while not stop.wait(interval):
+                try:
+                    if connections > 0:
+                        self.transport.keep_alive(FLIGHT_URL_BASE, connections)
+
+                    expires_at = self._auth[1]
+                    renew_at = expires_at - self.token_margin - interval if expires_at is not None else None
+
+                    if login and renew_at is not None and time.monotonic() >= renew_at:
+                        # Coalesced with concurrent logins: skipped if another thread renews the token meanwhile.
+                        self.login(force=True)
+                except Exception:
+                    logger.exception("Keep-alive failed")
+
+        threading.Thread(target=run, name="flight-keep-alive", daemon=True).start()
+
+    def stop_keep_alive(self):
+        """Stop the keep-alive thread, if running."""
+
+        if self._keep_alive_stop is not None:
+            self._keep_alive_stop.set()
+            self._keep_alive_stop = None
+
+    def build_search_decoder(
+            self,
+            *,
+            projection: Optional[List[str]],
+            transform: Optional[Callable[[Any], Any]]
+    ) -> Optional[Callable[[bytes], Any]]:
+        """Return the body decoder of a search: offloaded, projected and/or transformed, or None for response.json()."""
+
+        if self.offload is not None:
+            return lambda body: self.offload.decode(body, projection=projection, transform=transform)
+
+        if projection or transform is not None:
+            return lambda body: decode_body(body, projection, transform)
+
+        return None
+
+    @staticmethod
+    def build_search_filters(
+            *,
+            itinerary: List[SearchAvailabilityItinerary],
+            only_carriers: Optional[List[str]],
+            options: SearchOptions
+    ):
+        """Build the searchCriteria flight filters from the carrier list and the search options.
+
+        Raises ValueError if both only_carriers and options.excluded_carriers are set, as the API accepts only one.
+        """
+
+        if only_carriers and options.excluded_carriers:
+            raise ValueError("Provide either only_carriers or options.excluded_carriers")
+
+        flight_filters = {}
+        carrier_restrictions = {}
+        connection_restriction = {}
+
+        if only_carriers:
+            carrier_restrictions["includedCarrierCodes"] = only_carriers
+
+        if options.excluded_carriers:
+            carrier_restrictions["excludedCarrierCodes"] = options.excluded_carriers
+
+        if carrier_restrictions:
+            flight_filters["carrierRestrictions"] = carrier_restrictions
+
+        if options.cabin:
+            flight_filters["cabinRestrictions"] = [{
+                "cabin": options.cabin.value,
+                "coverage": "MOST_SEGMENTS",
+                "originDestinationIds": [route.id for route in itinerary]
+            }]
+
+        if options.max_stops is not None:
+            connection_restriction["maxNumberOfConnections"] = options.max_stops
+
+        if options.airport_change_allowed is not None:
+            connection_restriction["airportChangeAllowed"] = options.airport_change_allowed
+
+        if options.technical_stops_allowed is not None:
+            connection_restriction["technicalStopsAllowed"] = options.technical_stops_allowed
+
+        if connection_restriction:
+            flight_filters["connectionRestriction"] = connection_restriction
+
+        if not flight_filters:
+            return {}
+
+        return {"flightFilters": flight_filters}
+
+    @profiled
     def search_availability(
             self,
             *,
             itinerary: List[SearchAvailabilityItinerary],
             travelers: List[SearchAvailabilityPax],
             only_carriers: Optional[List[str]] = None,
+            options: Optional[SearchOptions] = None,
+            projection: Optional[List[str]] = None,
+            transform: Optional[Callable[[Any], Any]] = None,
+            passthrough: Optional[FlightPassthrough] = None,
             on_complete: Optional[Callable] = None
     ):
-        """Search for flight availability based on the provided itinerary and travelers."""
+        """Search for flight availability based on the provided itinerary and travelers.
 
-        self.login(on_complete=on_complete)
+        projection lists the dotted paths to keep from the response (e.g. "data.price.grandTotal"); everything else
+        is skipped while decoding. transform, if given, post-processes the decoded response (e.g. to filter or rank
+        the offers); with an offload pool both run in a worker process.
+        """
 
-        filters = {}
+        options = options or SearchOptions()
+        filters = self.build_search_filters(itinerary=itinerary, only_carriers=only_carriers, options=options)
 
-        if only_carriers:
-            filters = {
-                "flightFilters": {
-                    "carrierRestrictions": {
-                        "includedCarrierCodes": only_carriers
-                    }
-                }
-            }
+        self.check_circuit(FlightResultKind.FLIGHT_SEARCH)
+        self.login(on_complete=on_complete)
 
         payload = {
             "currencyCode": self.currency.value,
@@ -224,32 +675,36 @@ class FlightSDK:
                 }
                 for pax in travelers
             ],
-            "sources": [
-                "GDS"
-            ],
+            "sources": options.sources,
             "searchCriteria": {
                 "pricingOptions": {
-                    "fareType": [
-                        "PUBLISHED"
-                    ]
+                    "fareType": [fare_type.value for fare_type in options.fare_types]
                 },
                 "additionalInformation": {
-                    "brandedFares": True
+                    "brandedFares": options.branded_fares
                 },
-                "allowAlternativeFareOptions": True,
-                "maxUpsellOffers": 4,
-                "maxFlightOffers": 250,
+                "allowAlternativeFareOptions": options.allow_alternative_fare_options,
+                "maxUpsellOffers": options.max_upsell_offers,
+                "maxFlightOffers": options.max_flight_offers,
                 **filters
             }
         }
 
-        return self.request(
+        status, data = self.request(
             url=FlightEndpoints.FLIGHT_AVAILABILITY_ENDPOINT.value,
             payload=payload,
             on_complete=on_complete,
             kind=FlightResultKind.FLIGHT_SEARCH,
+            passthrough=passthrough,
+            decoder=self.build_search_decoder(projection=projection, transform=transform)
         )
 
+        if self.validator is not None and status == 200 and passthrough is None and transform is None:
+            self.validator.record(data.get("data", []))
+
+        return status, data
+
+    @profiled
     def pricing(
             self,
             *,
@@ -258,8 +713,30 @@ class FlightSDK:
             card_brand: Optional[CardBrand] = None,
             on_complete: Optional[Callable] = None
     ):
-        """Payload should be the flight offers obtained from search_availability method."""
+        """Payload should be the flight offers obtained from search_availability method.
+
+        Raises FlightOfferValidationError without calling Amadeus if the SDK validator rejects the offer.
+        """
+
+        if self.validator is not None:
+            self.validator.check(flight_data, FlightResultKind.FLIGHT_PRICING)
+
+        cache_key = None
+
+        if self.cache is not None:
+            cache_key = self.cache.build_key(
+                FlightResultKind.FLIGHT_PRICING,
+                offer_fingerprint(flight_data),
+                payment_method.value,
+                card_brand.value if card_brand else None,
+                self.currency.value
+            )
+            cached = self.cache.get(cache_key)
 
+            if cached is not None:
+                return cached
+
+        self.check_circuit(FlightResultKind.FLIGHT_PRICING)
         self.login(on_complete=on_complete)
 
         extra = {}
@@ -282,60 +759,184 @@ class FlightSDK:
             }
         }
 
-        return self.request(
+        status, data = self.request(
             url=FlightEndpoints.FLIGHT_PRICING_ENDPOINT.value,
             payload=payload,
             on_complete=on_complete,
             kind=FlightResultKind.FLIGHT_PRICING
         )
 
-    def retrieve_by_locator(self, *, locator: str, on_complete: Optional[Callable] = None):
-        """Retrieve a reservation by its locator code."""
+        if cache_key is not None and status == 200:
+            self.cache.set(cache_key, status, data)
+
+        if self.validator is not None and status == 200:
+            self.validator.record(data.get("data", {}).get("flightOffers", []))
+
+        return status, data
+
+    @profiled
+    def retrieve_by_locator(
+            self,
+            *,
+            locator: str,
+            max_staleness: Optional[float] = None,
+            passthrough: Optional[FlightPassthrough] = None,
+            on_complete: Optional[Callable] = None
+    ):
+        """Retrieve a reservation by its locator code.
+
+        With a store configured, a stored order younger than max_staleness seconds (the store max_age by default)
+        is returned without calling Amadeus. Passthrough calls always go to Amadeus and bypass the store.
+        """
 
+        if self.store is not None and passthrough is None:
+            stored = self.store.get_by_locator(locator, max_age=max_staleness)
+
+            if stored is not None:
+                order, dictionaries = stored
+                return 200, {"data": [order], **({"dictionaries": dictionaries} if dictionaries else {})}
+
+        self.check_circuit(FlightResultKind.FLIGHT_RETRIEVE_BY_PNR)
         self.login(on_complete=on_complete)
 
-        return self.request(
+        status, data = self.request(
             url=f"{FlightEndpoints.FLIGHT_RETRIEVE_BOOKING_BY_LOCATOR_ENDPOINT.value}&reference={locator}",
             method=RequestMethod.GET,
             on_complete=on_complete,
-            kind=FlightResultKind.FLIGHT_RETRIEVE_BY_PNR
+            kind=FlightResultKind.FLIGHT_RETRIEVE_BY_PNR,
+            passthrough=passthrough
         )
 
-    def retrieve_by_booking_id(self, *, booking_id: str, on_complete: Optional[Callable] = None):
-        """Retrieve a reservation by its booking ID."""
+        if self.store is not None and passthrough is None:
+            self.store.ingest(status, data)
+
+        return status, data
 
+    @profiled
+    def retrieve_by_booking_id(
+            self,
+            *,
+            booking_id: str,
+            max_staleness: Optional[float] = None,
+            passthrough: Optional[FlightPassthrough] = None,
+            on_complete: Optional[Callable] = None
+    ):
+        """Retrieve a reservation by its booking ID.
+
+        With a store configured, a stored order younger than max_staleness seconds (the store max_age by default)
+        is returned without calling Amadeus. Passthrough calls always go to Amadeus and bypass the store.
+        """
+
+        if self.store is not None and passthrough is None:
+            stored = self.store.get_by_booking_id(booking_id, max_age=max_staleness)
+
+            if stored is not None:
+                order, dictionaries = stored
+                return 200, {"data": order, **({"dictionaries": dictionaries} if dictionaries else {})}
+
+        self.check_circuit(FlightResultKind.FLIGHT_RETRIEVE_BY_ID)
         self.login(on_complete=on_complete)
 
-        return self.request(
+        status, data = self.request(
             url=f"{FlightEndpoints.FLIGHT_RETRIEVE_BOOKING_BY_ID_ENDPOINT.value}/{booking_id}",
             method=RequestMethod.GET,
             on_complete=on_complete,
-            kind=FlightResultKind.FLIGHT_RETRIEVE_BY_ID
+            kind=FlightResultKind.FLIGHT_RETRIEVE_BY_ID,
+            passthrough=passthrough
         )
 
+        if self.store is not None and passthrough is None:
+            self.store.ingest(status, data)
+
+        return status, data
+
+    def bulk_retrieve(
+            self,
+            *,
+            booking_ids: Optional[Iterable[str]] = None,
+            locators: Optional[Iterable[str]] = None,
+            max_workers: int = 8,
+            retries: int = 2,
+            backoff: float = 0.5,
+            max_staleness: Optional[float] = None,
+            on_complete: Optional[Callable] = None
+    ) -> Iterator[Tuple[str, Optional[int], Any]]:
+        """Retrieve many reservations concurrently by booking ID or by locator.
+
+        Yields (key, status, data) in completion order. Retryable statuses and connection errors are retried
+        per item; an item that still fails with an exception is yielded as (key, None, exception). The whole
+        run shares one access token and the SDK connection pool.
+        """
+
+        if (booking_ids is None) == (locators is None):
+            raise ValueError("Provide either booking_ids or locators")
+
+        keys = booking_ids if booking_ids is not None else locators
+
+        def retrieve(key: str):
+            if booking_ids is not None:
+                return self.retrieve_by_booking_id(booking_id=key, max_staleness=max_staleness,
+                                                   on_complete=on_complete)
+            return self.retrieve_by_locator(locator=key, max_staleness=max_staleness, on_complete=on_complete)
+
+        def on_retry(attempt: int, outcome: Any):
+            if outcome == 401:
+                self.invalidate_token()
+
+        def fetch(key: str):
+            return call_with_retries(
+                lambda: retrieve(key),
+                retries=retries,
+                backoff=backoff,
+                retry_on=TRANSPORT_ERRORS,
+                on_retry=on_retry
+            )
+
+        with self.shared_token(on_complete=on_complete):
+            for key, result in bounded_map(fetch, keys, max_workers=max_workers):
+                if isinstance(result, Exception):
+                    yield key, None, result
+                else:
+                    yield key, *result
+
+    @profiled
     def issue_booking(self, *, booking_id: str, on_complete: Optional[Callable] = None):
         """Issue a reservation by its booking ID."""
 
+        self.check_circuit(FlightResultKind.FLIGHT_ISSUE)
         self.login(on_complete=on_complete)
 
-        return self.request(
+        status, data = self.request(
             url=f"{FlightEndpoints.FLIGHT_ISSUE_BOOKING_ENDPOINT.value}/{booking_id}/issuance",
             on_complete=on_complete,
             kind=FlightResultKind.FLIGHT_ISSUE
         )
 
+        if self.store is not None:
+            self.store.ingest(status, data)
+
+        return status, data
+
+    @profiled
     def cancel_booking(self, *, booking_id: str, on_complete: Optional[Callable] = None):
         """Cancel a reservation by its booking ID."""
 
+        self.check_circuit(FlightResultKind.FLIGHT_CANCEL)
         self.login(on_complete=on_complete)
 
-        return self.request(
+        status, data = self.request(
             url=f"{FlightEndpoints.FLIGHT_CANCEL_BOOKING_ENDPOINT.value}/{booking_id}",
             method=RequestMethod.DELETE,
             on_complete=on_complete,
             kind=FlightResultKind.FLIGHT_CANCEL
         )
 
+        if self.store is not None and status in (200, 204):
+            self.store.delete(booking_id)
+
+        return status, data
+
+    @profiled
     def fm_commission_booking(
             self,
             *,
@@ -346,9 +947,10 @@ class FlightSDK:
     ):
         """Add a commission to a reservation by its booking ID."""
 
+        self.check_circuit(FlightResultKind.FLIGHT_COMMISSION_BOOKING)
         self.login(on_complete=on_complete)
 
-        return self.request(
+        status, data = self.request(
             url=f"{FlightEndpoints.FLIGHT_FM_COMMISSION_BOOKING_ENDPOINT.value}/{booking_id}",
             method=RequestMethod.PATCH,
             payload={
@@ -373,6 +975,12 @@ class FlightSDK:
             kind=FlightResultKind.FLIGHT_COMMISSION_BOOKING
         )
 
+        if self.store is not None:
+            self.store.ingest(status, data)
+
+        return status, data
+
+    @profiled
     def reserve(
             self,
             *,
@@ -384,8 +992,18 @@ class FlightSDK:
             queue_data: Optional[FlightReserveQueueData] = None,
             on_complete: Optional[Callable] = None
     ):
-        """Reserve a flight based on the provided pricing data, payment method, and traveler information."""
+        """Reserve a flight based on the provided pricing data, payment method, and traveler information.
+
+        Raises FlightOfferValidationError without calling Amadeus if the SDK validator rejects the offer.
+        """
+
+        if self.validator is not None:
+            self.validator.check(pricing_data, FlightResultKind.FLIGHT_RESERVE)
+
+        if self.cache is not None:
+            self.cache.invalidate(offer_fingerprint(pricing_data))
 
+        self.check_circuit(FlightResultKind.FLIGHT_RESERVE)
         self.login(on_complete=on_complete)
 
         payments = []
@@ -479,13 +1097,19 @@ class FlightSDK:
         if issue:
             url = f"{url}?issue=true"
 
-        return self.request(
+        status, data = self.request(
             url=url,
             payload=payload,
             on_complete=on_complete,
             kind=FlightResultKind.FLIGHT_RESERVE
         )
 
+        if self.store is not None:
+            self.store.ingest(status, data)
+
+        return status, data
+
+    @profiled
     def branded_fare_upsell(
             self,
             *,
@@ -494,6 +1118,20 @@ class FlightSDK:
     ):
         """Upsell branded fares based on the provided pricing data from a previous pricing response."""
 
+        cache_key = None
+
+        if self.cache is not None:
+            cache_key = self.cache.build_key(
+                FlightResultKind.FLIGHT_BRANDED_FARE_UPSELL,
+                offer_fingerprint(pricing_data),
+                self.currency.value
+            )
+            cached = self.cache.get(cache_key)
+
+            if cached is not None:
+                return cached
+
+        self.check_circuit(FlightResultKind.FLIGHT_BRANDED_FARE_UPSELL)
         self.login(on_complete=on_complete)
 
         payload = {
@@ -505,35 +1143,107 @@ class FlightSDK:
             }
         }
 
-        return self.request(
+        status, data = self.request(
             url=FlightEndpoints.FLIGHT_BRANDED_FARE_UPSELL.value,
             payload=payload,
             on_complete=on_complete,
             kind=FlightResultKind.FLIGHT_BRANDED_FARE_UPSELL
         )
 
+        if cache_key is not None and status == 200:
+            self.cache.set(cache_key, status, data)
+
+        return status, data
+
+    def bulk_branded_fare_upsell(
+            self,
+            *,
+            pricing_data: Iterable[Any],
+            key: Callable[[Any], str] = lambda offer: offer.get("id"),
+            max_workers: int = 4,
+            retries: int = 2,
+            backoff: float = 0.5,
+            on_complete: Optional[Callable] = None
+    ) -> FlightUpsellResults:
+        """Upsell branded fares for several priced offers concurrently and merge the options per offer.
+
+        Offers flying the same segments share one upsell call. The options of every offer, keyed by key(offer),
+        are normalized into FlightBrandOption lists, cheapest first; offers whose call failed are reported in
+        errors with the failing status and data, or the exception. Raises ValueError if two offers share a key.
+        """
+
+        groups = {}
+        keys = set()
+
+        for offer in pricing_data:
+            offer_key = key(offer)
+
+            if offer_key in keys:
+                raise ValueError(f"Duplicate offer key: {offer_key}")
+
+            keys.add(offer_key)
+            fingerprint = segments_fingerprint(offer)
+
+            if fingerprint in groups:
+                groups[fingerprint][1].append(offer_key)
+            else:
+                groups[fingerprint] = (offer, [offer_key])
+
+        results = FlightUpsellResults(calls=len(groups))
+
+        def on_retry(attempt: int, outcome: Any):
+            if outcome == 401:
+                self.invalidate_token()
+
+        def upsell(fingerprint: str):
+            return call_with_retries(
+                lambda: self.branded_fare_upsell(pricing_data=groups[fingerprint][0], on_complete=on_complete),
+                retries=retries,
+                backoff=backoff,
+                retry_on=TRANSPORT_ERRORS,
+                on_retry=on_retry
+            )
+
+        with self.shared_token(on_complete=on_complete):
+            for fingerprint, result in bounded_map(upsell, list(groups), max_workers=max_workers):
+                offer_keys = groups[fingerprint][1]
+
+                if isinstance(result, Exception) or result[0] != 200:
+                    for offer_key in offer_keys:
+                        results.errors[offer_key] = result
+                    continue
+
+                options = brand_options(result[1].get("data", []))
+
+                for offer_key in offer_keys:
+                    results.options[offer_key] = options
+
+        return results
+
+    @profiled
     def search_availabilities(
             self,
             *,
             itinerary: List[SearchAvailabilityItinerary],
             travelers: List[SearchAvailabilityPax],
             only_carriers: Optional[List[str]] = None,
+            options: Optional[SearchOptions] = None,
+            projection: Optional[List[str]] = None,
+            transform: Optional[Callable[[Any], Any]] = None,
+            passthrough: Optional[FlightPassthrough] = None,
             on_complete: Optional[Callable] = None
     ):
-        """Search for flight availabilities based on the provided itinerary and travelers."""
+        """Search for flight availabilities based on the provided itinerary and travelers.
 
-        self.login(on_complete=on_complete)
+        projection lists the dotted paths to keep from the response; everything else is skipped while decoding.
+        transform, if given, post-processes the decoded response; with an offload pool both run in a worker process.
+        """
 
-        filters = {}
+        options = options or SearchOptions()
+        filters = self.build_search_filters(itinerary=itinerary, only_carriers=only_carriers, options=options)
 
-        if only_carriers:
-            filters = {
-                "flightFilters": {
-                    "carrierRestrictions": {
-                        "includedCarrierCodes": only_carriers
-                    }
-                }
-            }
+        self.check_circuit(FlightResultKind.FLIGHT_AVAILABILITIES)
+        self.login(on_complete=on_complete)
 
         payload = {
             "originDestinations": [
@@ -558,17 +1268,13 @@ class FlightSDK:
                 }
                 for pax in travelers
             ],
-            "sources": [
-                "GDS"
-            ],
+            "sources": options.sources,
             "searchCriteria": {
                 "pricingOptions": {
-                    "fareType": [
-                        "PUBLISHED"
-                    ]
+                    "fareType": [fare_type.value for fare_type in options.fare_types]
                 },
                 "additionalInformation": {
-                    "brandedFares": True
+                    "brandedFares": options.branded_fares
                 },
                 **filters
             }
@@ -578,26 +1284,72 @@ class FlightSDK:
             url=FlightEndpoints.FLIGHT_AVAILABILITIES_ENDPOINT.value,
             payload=payload,
             on_complete=on_complete,
-            kind=FlightResultKind.FLIGHT_AVAILABILITIES
+            kind=FlightResultKind.FLIGHT_AVAILABILITIES,
+            passthrough=passthrough,
+            decoder=self.build_search_decoder(projection=projection, transform=transform)
         )
 
+    @profiled
     def queue_list(
             self,
             *,
             queue: str,
             category: str,
+            page_size: Optional[int] = None,
             on_complete: Optional[Callable] = None
     ):
         """View queue list"""
 
+        self.check_circuit(FlightResultKind.FLIGHT_QUEUE_LIST)
         self.login(on_complete=on_complete)
 
+        payload = {
+            "category": category
+        }
+
+        if page_size:
+            payload["page[limit]"] = page_size
+
         return self.request(
             url=f"{FlightEndpoints.FLIGHT_QUEUE_LIST.value}/{queue}",
             on_complete=on_complete,
             kind=FlightResultKind.FLIGHT_QUEUE_LIST,
             method=RequestMethod.GET,
-            payload={
-                "category": category
-            }
+            payload=payload
         )
+
+    def iter_queue_list(
+            self,
+            *,
+            queue: str,
+            category: str,
+            page_size: Optional[int] = None,
+            on_complete: Optional[Callable] = None
+    ) -> Iterator[Any]:
+        """Yield the entries of a queue page by page, following the meta.links.next pagination links.
+
+        Only one page is held in memory at a time. Raises ValueError if a page cannot be retrieved.
+        """
+
+        status, data = self.queue_list(queue=queue, category=category, page_size=page_size, on_complete=on_complete)
+
+        while True:
+            if status != 200:
+                raise ValueError(f"Unable to retrieve queue {queue} page: status {status}")
+
+            yield from data.get("data", [])
+
+            next_url = (data.get("meta") or {}).get("links", {}).get("next")
+
+            if not next_url:
+                return
+
+            self.check_circuit(FlightResultKind.FLIGHT_QUEUE_LIST)
+            self.login(on_complete=on_complete)
+
+            status, data = self.request(
+                url=next_url,
+                on_complete=on_complete,
+                kind=FlightResultKind.FLIGHT_QUEUE_LIST,
+                method=RequestMethod.GET
+            )
@@ -0,0 +1,193 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: store.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Optional, List, Tuple
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS flight_orders (
+    booking_id TEXT PRIMARY KEY,
+    locator TEXT,
+    data TEXT NOT NULL,
+    dictionaries TEXT,
+    updated_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS flight_orders_locator ON flight_orders (locator);
+CREATE TABLE IF NOT EXISTS flight_order_passengers (
+    booking_id TEXT NOT NULL,
+    surname TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS flight_order_passengers_surname ON flight_order_passengers (surname);
+CREATE INDEX IF NOT EXISTS flight_order_passengers_booking ON flight_order_passengers (booking_id);
+CREATE TABLE IF NOT EXISTS flight_order_departures (
+    booking_id TEXT NOT NULL,
+    departure_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS flight_order_departures_date ON flight_order_departures (departure_date);
+CREATE INDEX IF NOT EXISTS flight_order_departures_booking ON flight_order_departures (booking_id);
+"""
+
+
+def order_locator(order: Any) -> Optional[str]:
+    """Return the GDS record locator of a flight order, or the first associated record reference."""
+
+    records = order.get("associatedRecords", [])
+
+    for record in records:
+        if record.get("originSystemCode") == "GDS" and record.get("reference"):
+            return record["reference"]
+
+    return records[0].get("reference") if records else None
+
+
+def order_surnames(order: Any) -> List[str]:
+    """Return the upper-cased passenger surnames of a flight order."""
+
+    return sorted({
+        traveler["name"]["lastName"].upper()
+        for traveler in order.get("travelers", [])
+        if traveler.get("name", {}).get("lastName")
+    })
+
+
+def order_departure_dates(order: Any) -> List[str]:
+    """Return the departure date (YYYY-MM-DD) of every itinerary of a flight order."""
+
+    return sorted({
+        itinerary["segments"][0]["departure"]["at"][:10]
+        for offer in order.get("flightOffers", [])
+        for itinerary in offer.get("itineraries", [])
+        if itinerary.get("segments") and itinerary["segments"][0].get("departure", {}).get("at")
+    })
+
+
+class FlightOrderStore:
+    """Local sqlite index of flight orders, used to serve retrieves within a staleness budget."""
+
+    def __init__(self, path: str = ":memory:", *, max_age: float = 300.0):
+        """Open (or create) the store at path; entries older than max_age seconds are considered stale."""
+
+        self.path = path
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False, isolation_level=None)
+
+        if path != ":memory:":
+            self._connection.execute("PRAGMA journal_mode=WAL")
+
+        self._connection.executescript(SCHEMA)
+
+    def put(self, order: Any, *, dictionaries: Any = None):
+        """Insert or replace a flight order and its surname and departure date index entries."""
+
+        booking_id = order.get("id")
+
+        if not booking_id:
+            return
+
+        with self._lock:
+            connection = self._connection
+            connection.execute("BEGIN")
+
+            try:
+                connection.execute(
+                    "INSERT OR REPLACE INTO flight_orders (booking_id, locator, data, dictionaries, updated_at) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (booking_id, order_locator(order), json.dumps(order),
+                     json.dumps(dictionaries) if dictionaries is not None else None, time.time())
+                )
+                connection.execute("DELETE FROM flight_order_passengers WHERE booking_id = ?", (booking_id,))
+                connection.execute("DELETE FROM flight_order_departures WHERE booking_id = ?", (booking_id,))
+                connection.executemany("INSERT INTO flight_order_passengers (booking_id, surname) VALUES (?, ?)",
+                                       [(booking_id, surname) for surname in order_surnames(order)])
+                connection.executemany("INSERT INTO flight_order_departures (booking_id, departure_date) VALUES (?, ?)",
+                                       [(booking_id, date) for date in order_departure_dates(order)])
+                connection.execute("COMMIT")
+            except Exception:
+                connection.execute("ROLLBACK")
+                raise
+
+    def ingest(self, status: int, data: Any):
+        """Store the flight order(s) contained in a successful reserve, retrieve, issue or commission response."""
+
+        if status not in (200, 201) or not isinstance(data, dict):
+            return
+
+        orders = data.get("data")
+
+        for order in orders if isinstance(orders, list) else [orders]:
+            if isinstance(order, dict) and order.get("type", "flight-order") == "flight-order":
+                self.put(order, dictionaries=data.get("dictionaries"))
+
+    def delete(self, booking_id: str):
+        """Remove a flight order from the store."""
+
+        with self._lock:
+            self._connection.execute("DELETE FROM flight_orders WHERE booking_id = ?", (booking_id,))
+            self._connection.execute("DELETE FROM flight_order_passengers WHERE booking_id = ?", (booking_id,))
+            self._connection.execute("DELETE FROM flight_order_departures WHERE booking_id = ?", (booking_id,))
+
+    def get_by_booking_id(self, booking_id: str, *, max_age: Optional[float] = None) -> Optional[Tuple[Any, Any]]:
+        """Return (order, dictionaries) for a booking ID if stored within the staleness budget, else None."""
+
+        return self._get_fresh("booking_id", booking_id, max_age)
+
+    def get_by_locator(self, locator: str, *, max_age: Optional[float] = None) -> Optional[Tuple[Any, Any]]:
+        """Return (order, dictionaries) for a record locator if stored within the staleness budget, else None."""
+
+        return self._get_fresh("locator", locator, max_age)
+
+    def find(self, *, surname: Optional[str] = None, departure_date: Optional[str] = None) -> List[Any]:
+        """Return the stored flight orders matching a passenger surname and/or a departure date, whatever their age."""
+
+        query = "SELECT data FROM flight_orders WHERE 1 = 1"
+        params = []
+
+        if surname:
+            query += " AND booking_id IN (SELECT booking_id FROM flight_order_passengers WHERE surname = ?)"
+            params.append(surname.upper())
+
+        if departure_date:
+            query += " AND booking_id IN (SELECT booking_id FROM flight_order_departures WHERE departure_date = ?)"
+            params.append(departure_date)
+
+        with self._lock:
+            rows = self._connection.execute(query, params).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def close(self):
+        """Close the underlying sqlite connection."""
+
+        with self._lock:
+            self._connection.close()
+
+    def _get_fresh(self, column: str, value: str, max_age: Optional[float]) -> Optional[Tuple[Any, Any]]:
+        """Look up one order by an indexed column, counting hits and misses against the staleness budget."""
+
+        max_age = self.max_age if max_age is None else max_age
+
+        with self._lock:
+            row = self._connection.execute(
+                f"SELECT data, dictionaries, updated_at FROM flight_orders WHERE {column} = ? "
+                f"ORDER BY updated_at DESC LIMIT 1",
+                (value,)
+            ).fetchone()
+
+            if row is None or time.time() - row[2] > max_age:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+
+        return json.loads(row[0]), json.loads(row[1]) if row[1] else None
@@ -0,0 +1,344 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: transports.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import json
+import threading
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from sythonlab_amadeus_enterprise_rest.core.enums import RequestMethod
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# Connection-level errors of every transport, retried by the bulk helpers.
+TRANSPORT_ERRORS: Tuple[type, ...] = (requests.RequestException, urllib3.exceptions.HTTPError) + \
+    ((httpx.TransportError,) if httpx is not None else ())
+
+
+def encode_body(payload: Any, use_json: bool) -> Tuple[bytes, str]:
+    """Encode a request payload as JSON or as a form and return it with its content type; bytes are already encoded."""
+
+    if isinstance(payload, bytes):
+        return payload, "application/json" if use_json else "application/x-www-form-urlencoded"
+
+    if use_json:
+        # Same encoding as requests' json= argument, so every transport sends identical bodies.
+        return json.dumps(payload, allow_nan=False).encode("utf-8"), "application/json"
+
+    return urlencode(payload or {}).encode("utf-8"), "application/x-www-form-urlencoded"
+
+
+def with_params(url: str, params: Any) -> str:
+    """Append query parameters to a URL that may already have a query string."""
+
+    if not params:
+        return url
+
+    return f"{url}{'&' if '?' in url else '?'}{urlencode(params)}"
+
+
+class TransportRawStream:
+    """Undecoded body of a streamed TransportResponse, exposing the urllib3-style stream() used for passthrough."""
+
+    def __init__(self, chunks: Callable[[int], Iterator[bytes]]):
+        self._chunks = chunks
+
+    def stream(self, chunk_size: int = 64 * 1024, decode_content: bool = False) -> Iterator[bytes]:
+        """Iterate over the body as received on the wire, still compressed."""
+
+        return self._chunks(chunk_size)
+
+
+class TransportResponse:
+    """Response returned by the non-requests transports, with the subset of the requests.Response API the SDK uses."""
+
+    def __init__(
+            self,
+            *,
+            status_code: int,
+            headers: Dict[str, str],
+            content: Optional[bytes] = None,
+            chunks: Optional[Callable[[int], Iterator[bytes]]] = None,
+            raw_chunks: Optional[Callable[[int], Iterator[bytes]]] = None,
+            release: Optional[Callable[[], None]] = None
+    ):
+        """Wrap a response given either its decoded content or callables iterating over the (raw) body."""
+
+        self.status_code = status_code
+        self.headers = CaseInsensitiveDict(headers)
+        self._content = content
+        self._chunks = chunks
+        self.raw = TransportRawStream(raw_chunks or chunks or (lambda chunk_size: iter([content or b""])))
+        self._release = release
+
+    @property
+    def content(self) -> bytes:
+        """Decoded response body, read on first access."""
+
+        if self._content is None:
+            self._content = b"".join(self._chunks(64 * 1024)) if self._chunks else b""
+            self.close()
+
+        return self._content
+
+    @property
+    def text(self) -> str:
+        """Response body as text."""
+
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        """Decode the response body as JSON."""
+
+        return json.loads(self.content)
+
+    def iter_content(self, chunk_size: int = 64 * 1024) -> Iterator[bytes]:
+        """Iterate over the decoded response body."""
+
+        if self._content is not None or self._chunks is None:
+            return iter([self.content])
+
+        return self._chunks(chunk_size)
+
+    def close(self):
+        """Release the underlying connection."""
+
+        if self._release is not None:
+            release, self._release = self._release, None
+            release()
+
+
+class FlightTransport(ABC):
+    """Interface of the HTTP backends a FlightSDK sends its requests through.
+
+    POST payloads are sent as JSON or as a form (use_json), PATCH payloads as JSON, and GET, DELETE and HEAD
+    payloads as query parameters. The SDK sends JSON payloads already encoded as bytes. The returned response must
+    provide status_code, headers, content, text, json(), iter_content(), raw.stream() and close(), like
+    requests.Response does.
+    """
+
+    @abstractmethod
+    def send(self, *, method: RequestMethod, url: str, payload: Any, headers: dict, use_json: bool,
+             stream: bool = False) -> Any:
+        """Send one request and return its response."""
+
+    def warm_up(self, url: str, connections: int) -> int:
+        """Open up to connections keep-alive connections to the host of url and return how many are ready."""
+
+        return self.keep_alive(url, connections)
+
+    def keep_alive(self, url: str, connections: int) -> int:
+        """Send connections concurrent HEAD requests to url so the server does not drop idle pooled connections.
+
+        Concurrent requests each take their own pooled connection, and dropped connections are reopened on the way.
+        Returns how many requests were answered, whatever their status.
+        """
+
+        if connections <= 0:
+            return 0
+
+        barrier = threading.Barrier(connections)
+
+        def touch(_):
+            try:
+                barrier.wait(timeout=5)
+            except threading.BrokenBarrierError:
+                pass
+
+            # A HEAD response has no body to drain, so closing hands the connection straight back to the pool.
+            response = self.send(method=RequestMethod.HEAD, url=url, payload=None, headers={}, use_json=True)
+            response.close()
+
+        with ThreadPoolExecutor(max_workers=connections) as executor:
+            futures = [executor.submit(touch, index) for index in range(connections)]
+
+        return sum(1 for future in futures if future.exception() is None)
+
+    def close(self):
+        """Close the pooled connections of the transport."""
+
+
+class RequestsTransport(FlightTransport):
+    """Transport over a requests.Session with a connection pool of pool_size per host (the default)."""
+
+    def __init__(self, *, pool_size: int = 10, session: Optional[requests.Session] = None):
+        """Initialize the transport with its own pooled session, or with the given one."""
+
+        self.session = session or requests.Session()
+        self.pool_size = pool_size
+
+        if session is None:
+            self.session.mount("https://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+            self.session.mount("http://", HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size))
+
+    def send(self, *, method: RequestMethod, url: str, payload: Any, headers: dict, use_json: bool,
+             stream: bool = False) -> Any:
+        """Send one request through the session."""
+
+        if method == RequestMethod.POST:
+            if use_json and not isinstance(payload, bytes):
+                return self.session.post(url, json=payload, headers=headers, stream=stream)
+            return self.session.post(url, data=payload, headers=headers, stream=stream)
+        elif method == RequestMethod.PATCH:
+            if isinstance(payload, bytes):
+                return self.session.patch(url, data=payload, headers=headers, stream=stream)
+            return self.session.patch(url, json=payload, headers=headers, stream=stream)
+        elif method == RequestMethod.GET:
+            return self.session.get(url, params=payload, headers=headers, stream=stream)
+        elif method == RequestMethod.DELETE:
+            return self.session.delete(url, params=payload, headers=headers, stream=stream)
+        elif method == RequestMethod.HEAD:
+            return self.session.head(url, params=payload, headers=headers, stream=stream)
+
+        raise ValueError("Unsupported request method")
+
+    def close(self):
+        """Close the session and its pooled connections."""
+
+        self.session.close()
+
+
+class Urllib3Transport(FlightTransport):
+    """Transport over a raw urllib3 pool manager, without the per-request overhead of requests."""
+
+    def __init__(self, *, pool_size: int = 10, timeout: Optional[float] = None, **pool_kwargs):
+        """Initialize the pool manager with pool_size connections per host."""
+
+        self.pool = urllib3.PoolManager(maxsize=pool_size, timeout=timeout, retries=False, **pool_kwargs)
+
+    def send(self, *, method: RequestMethod, url: str, payload: Any, headers: dict, use_json: bool,
+             stream: bool = False) -> TransportResponse:
+        """Send one request through the pool manager."""
+
+        body = None
+
+        if method in (RequestMethod.POST, RequestMethod.PATCH):
+            body, content_type = encode_body(payload, use_json or method == RequestMethod.PATCH)
+            headers = {"Content-Type": content_type, **headers}
+        elif method in (RequestMethod.GET, RequestMethod.DELETE, RequestMethod.HEAD):
+            url = with_params(url, payload)
+        else:
+            raise ValueError("Unsupported request method")
+
+        response = self.pool.request(method.value, url, body=body, headers=headers, preload_content=not stream)
+
+        if not stream:
+            return TransportResponse(status_code=response.status, headers=dict(response.headers),
+                                     content=response.data)
+
+        return TransportResponse(
+            status_code=response.status,
+            headers=dict(response.headers),
+            chunks=lambda chunk_size: response.stream(chunk_size, decode_content=True),
+            raw_chunks=lambda chunk_size: response.stream(chunk_size, decode_content=False),
+            release=response.release_conn
+        )
+
+    def close(self):
+        """Close every pooled connection."""
+
+        self.pool.clear()
+
+
+class HttpxTransport(FlightTransport):
+    """Transport over an httpx client, multiplexing requests over HTTP/2 connections when http2 is set.
+
+    Requires the optional httpx package (httpx[http2] for HTTP/2).
+    """
+
+    def __init__(self, *, http2: bool = True, pool_size: int = 10, timeout: Optional[float] = None, **client_kwargs):
+        """Initialize the httpx client; raises ImportError if httpx is not installed."""
+
+        if httpx is None:
+            raise ImportError("HttpxTransport requires httpx: pip install 'sythonlab_amadeus_enterprise_rest[httpx]'")
+
+        self.client = httpx.Client(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=pool_size, max_keepalive_connections=pool_size),
+            **client_kwargs
+        )
+
+    def send(self, *, method: RequestMethod, url: str, payload: Any, headers: dict, use_json: bool,
+             stream: bool = False) -> TransportResponse:
+        """Send one request through the httpx client."""
+
+        body = None
+
+        if method in (RequestMethod.POST, RequestMethod.PATCH):
+            body, content_type = encode_body(payload, use_json or method == RequestMethod.PATCH)
+            headers = {"Content-Type": content_type, **headers}
+        elif method in (RequestMethod.GET, RequestMethod.DELETE, RequestMethod.HEAD):
+            url = with_params(url, payload)
+        else:
+            raise ValueError("Unsupported request method")
+
+        request = self.client.build_request(method.value, url, content=body, headers=headers)
+        response = self.client.send(request, stream=stream)
+
+        if not stream:
+            return TransportResponse(status_code=response.status_code, headers=dict(response.headers),
+                                     content=response.content)
+
+        return TransportResponse(
+            status_code=response.status_code,
+            headers=dict(response.headers),
+            chunks=lambda chunk_size: response.iter_bytes(chunk_size),
+            raw_chunks=lambda chunk_size: response.iter_raw(chunk_size),
+            release=response.close
+        )
+
+    def close(self):
+        """Close the client and its connections."""
+
+        self.client.close()
+
+
+class InMemoryTransport(FlightTransport):
+    """Transport answering from a handler in the same process, for tests and benchmarks without a network.
+
+    handler(method, url, payload, headers) returns a (status, data) tuple: dicts and lists are encoded as JSON,
+    bytes are sent as they are. Every request is recorded in requests as (method, url, payload, headers).
+    """
+
+    def __init__(self, handler: Callable[[RequestMethod, str, Any, dict], Tuple[int, Union[bytes, Any]]]):
+        """Initialize the transport with the handler answering its requests."""
+
+        self.handler = handler
+        self.requests: List[Tuple[RequestMethod, str, Any, dict]] = []
+        self._lock = threading.Lock()
+
+    def send(self, *, method: RequestMethod, url: str, payload: Any, headers: dict, use_json: bool,
+             stream: bool = False) -> TransportResponse:
+        """Record the request and answer it with the handler."""
+
+        if isinstance(payload, bytes):
+            payload = json.loads(payload)
+
+        with self._lock:
+            self.requests.append((method, url, payload, headers))
+
+        status, data = self.handler(method, url, payload, headers)
+        content = data if isinstance(data, bytes) else json.dumps(data).encode("utf-8")
+
+        return TransportResponse(status_code=status, headers={"Content-Type": "application/json"}, content=content)
+
+    def keep_alive(self, url: str, connections: int) -> int:
+        """Nothing to keep alive in memory."""
+
+        return connections
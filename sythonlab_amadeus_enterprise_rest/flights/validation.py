@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: validation.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightOfferRejection, FlightResultKind
+from sythonlab_amadeus_enterprise_rest.flights.exceptions import FlightOfferValidationError
+from sythonlab_amadeus_enterprise_rest.flights.fingerprints import offer_fingerprint
+
+# Largest negative UTC offset: a local departure time is at most this much earlier than the same time in UTC.
+MAX_UTC_BEHIND = timedelta(hours=12)
+
+
+def seats_needed(offer: Any) -> int:
+    """Return the number of seats an offer books: one per traveler pricing except held infants."""
+
+    return sum(1 for pricing in offer.get("travelerPricings", [])
+               if pricing.get("travelerType") != TravelerType.INFANT.value)
+
+
+def first_departure(offer: Any) -> Optional[datetime]:
+    """Return the local departure time of the first segment of an offer."""
+
+    for itinerary in offer.get("itineraries", []):
+        for segment in itinerary.get("segments", []):
+            departure = segment.get("departure", {}).get("at")
+            return datetime.fromisoformat(departure) if departure else None
+
+    return None
+
+
+class OfferValidator:
+    """Local pre-check of flight offers, rejecting the ones pricing or reserve would refuse anyway.
+
+    An offer is rejected when its last ticketing date has passed, when its first departure is less than
+    min_departure_lead seconds away, when it has fewer bookable seats than travelers, or when the search it came
+    from (see record) is older than max_search_age seconds. Departure times are local to the airport and carry no
+    offset, so a departure only counts as too soon if it is too soon in the latest time zone: valid offers are
+    never rejected. Offers whose search was not recorded are not checked for age.
+    """
+
+    def __init__(
+            self,
+            *,
+            min_departure_lead: float = 2 * 3600,
+            max_search_age: Optional[float] = 30 * 60,
+            max_entries: int = 10000
+    ):
+        """Initialize the validator thresholds and the number of recorded offers remembered."""
+
+        self.min_departure_lead = min_departure_lead
+        self.max_search_age = max_search_age
+        self.max_entries = max_entries
+        self.avoided: Dict[str, int] = {}
+        self.checked = 0
+        self._searched_at: "OrderedDict[str, float]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def record(self, offers: List[Any], searched_at: Optional[float] = None):
+        """Remember when the given offers were returned by a search (or refreshed by pricing)."""
+
+        searched_at = time.time() if searched_at is None else searched_at
+        fingerprints = [offer_fingerprint(offer) for offer in offers]
+
+        with self._lock:
+            for fingerprint in fingerprints:
+                self._searched_at[fingerprint] = searched_at
+                self._searched_at.move_to_end(fingerprint)
+
+            while len(self._searched_at) > self.max_entries:
+                self._searched_at.popitem(last=False)
+
+    def validate(self, offer: Any, now: Optional[float] = None) -> List[FlightOfferRejection]:
+        """Return the reasons the offer would be refused; empty if it may be valid."""
+
+        now = time.time() if now is None else now
+        current = datetime.fromtimestamp(now, timezone.utc).replace(tzinfo=None)
+        reasons = []
+
+        last_ticketing_date = offer.get("lastTicketingDate")
+        earliest_local_date = (current - MAX_UTC_BEHIND).date()
+
+        if last_ticketing_date and datetime.fromisoformat(last_ticketing_date).date() < earliest_local_date:
+            reasons.append(FlightOfferRejection.TICKETING_DEADLINE_PASSED)
+
+        departure = first_departure(offer)
+
+        if departure is not None and departure + MAX_UTC_BEHIND < current + timedelta(seconds=self.min_departure_lead):
+            reasons.append(FlightOfferRejection.DEPARTURE_TOO_SOON)
+
+        seats = offer.get("numberOfBookableSeats")
+
+        if seats is not None and seats < seats_needed(offer):
+            reasons.append(FlightOfferRejection.NOT_ENOUGH_SEATS)
+
+        if self.max_search_age is not None:
+            with self._lock:
+                searched_at = self._searched_at.get(offer_fingerprint(offer))
+
+            if searched_at is not None and now - searched_at > self.max_search_age:
+                reasons.append(FlightOfferRejection.SEARCH_TOO_OLD)
+
+        return reasons
+
+    def check(self, offer: Any, kind: Optional[FlightResultKind] = None):
+        """Raise FlightOfferValidationError if the offer would be refused, counting the call avoided for the kind."""
+
+        reasons = self.validate(offer)
+
+        with self._lock:
+            self.checked += 1
+
+            if reasons:
+                key = kind.value if kind else "UNKNOWN"
+                self.avoided[key] = self.avoided.get(key, 0) + 1
+
+        if reasons:
+            raise FlightOfferValidationError(offer.get("id"), reasons)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return the number of offers checked and of calls avoided per kind."""
+
+        with self._lock:
+            return {"checked": self.checked, "avoided": dict(self.avoided), "total_avoided": sum(self.avoided.values())}
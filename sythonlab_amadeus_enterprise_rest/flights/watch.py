@@ -0,0 +1,259 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+File: watch.py
+Author: Sython Lab (sythonlab@gmail.com)
+Created: 2026-10-18
+"""
+
+import heapq
+import json
+import logging
+import math
+import os
+import random
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from sythonlab_amadeus_enterprise_rest.flights.concurrency import RateLimiter, bounded_map
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import FlightWatchEntry, FlightFareChange
+from sythonlab_amadeus_enterprise_rest.flights.offers import offer_price, PRICE_PROJECTION
+
+logger = logging.getLogger(__name__)
+
+
+class FareWatcher:
+    """Re-poll a watchlist of searches under a global searches-per-second budget and emit lowest fare changes.
+
+    Each entry is searched every interval seconds, +/- jitter (a fraction of the interval), and first polls are
+    spread over one interval, so polls stay evenly distributed instead of lining up. All searches share a token
+    bucket of rate searches per second without bursts. Only a minimum fare that differs from the last observed one
+    by at least min_change is emitted. The last fares and due times are persisted to state_path: after a restart,
+    entries keep their schedule and the overdue ones are spread over the time the budget needs to serve them.
+    """
+
+    def __init__(
+            self,
+            sdk: Any,
+            *,
+            entries: Optional[Iterable[FlightWatchEntry]] = None,
+            rate: float = 1.0,
+            jitter: float = 0.1,
+            min_change: float = 0.0,
+            state_path: Optional[str] = None,
+            max_workers: int = 4,
+            on_change: Optional[Callable[[FlightFareChange], None]] = None,
+            on_complete: Optional[Callable] = None
+    ):
+        """Initialize the watcher for a FlightSDK, loading the persisted state if state_path exists."""
+
+        self.sdk = sdk
+        self.rate = rate
+        self.jitter = jitter
+        self.min_change = min_change
+        self.state_path = state_path
+        self.max_workers = max_workers
+        self.on_change = on_change
+        self.on_complete = on_complete
+        self.limiter = RateLimiter(rate, burst=1)
+        self.entries: Dict[str, FlightWatchEntry] = {}
+        self.state: Dict[str, Dict[str, Any]] = self.load_state()
+        now = time.time()
+        self.catch_up = sum(1 for values in self.state.values() if values.get("next_at", now) < now) / rate
+        self._schedule: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+
+        for entry in entries or ():
+            self.add(entry)
+
+    def load_state(self) -> Dict[str, Dict[str, Any]]:
+        """Read the persisted fares and due times, keyed by entry."""
+
+        if not self.state_path or not os.path.exists(self.state_path):
+            return {}
+
+        with open(self.state_path, "r", encoding="utf-8") as state_file:
+            return json.load(state_file).get("entries", {})
+
+    def save_state(self):
+        """Atomically rewrite the state file, if configured."""
+
+        if not self.state_path:
+            return
+
+        with self._lock:
+            entries = {key: dict(values) for key, values in self.state.items() if key in self.entries}
+
+        tmp_path = f"{self.state_path}.tmp"
+
+        with open(tmp_path, "w", encoding="utf-8") as state_file:
+            json.dump({"updated_at": datetime.now(timezone.utc).isoformat(), "entries": entries}, state_file)
+
+        os.replace(tmp_path, self.state_path)
+
+    def add(self, entry: FlightWatchEntry):
+        """Add (or replace) a watched search, keeping its persisted schedule if any."""
+
+        now = time.time()
+
+        with self._lock:
+            self.entries[entry.key] = entry
+            state = self.state.setdefault(entry.key, {})
+            due_at = state.get("next_at")
+
+            if due_at is None:
+                due_at = now + random.uniform(0, entry.interval)
+            elif due_at < now:
+                due_at = now + random.uniform(0, min(entry.interval, self.catch_up))
+
+            state["next_at"] = due_at
+            heapq.heappush(self._schedule, (due_at, entry.key))
+
+    def remove(self, key: str):
+        """Stop watching a search."""
+
+        with self._lock:
+            self.entries.pop(key, None)
+            self.state.pop(key, None)
+
+    def next_due(self) -> Optional[float]:
+        """Return the wall-clock time at which the next search is due."""
+
+        with self._lock:
+            self._discard_stale()
+            return self._schedule[0][0] if self._schedule else None
+
+    def poll_due(self, now: Optional[float] = None) -> List[FlightFareChange]:
+        """Search every entry due at now and return (and emit) the lowest fare changes."""
+
+        now = time.time() if now is None else now
+        due = []
+        popped = {}
+
+        with self._lock:
+            self._discard_stale()
+
+            while self._schedule and self._schedule[0][0] <= now:
+                due_at, key = heapq.heappop(self._schedule)
+                due.append(self.entries[key])
+                popped[key] = due_at
+                self._discard_stale()
+
+        if not due:
+            return []
+
+        def search(entry: FlightWatchEntry):
+            self.limiter.acquire()
+            return self.sdk.search_availability(
+                itinerary=entry.itinerary,
+                travelers=entry.travelers,
+                only_carriers=entry.only_carriers,
+                options=entry.options,
+                projection=PRICE_PROJECTION,
+                on_complete=self.on_complete
+            )
+
+        changes = []
+
+        try:
+            with self.sdk.shared_token(on_complete=self.on_complete):
+                for entry, result in bounded_map(search, due, max_workers=self.max_workers):
+                    change = self._observe(entry, result)
+                    popped.pop(entry.key, None)
+
+                    if change is not None:
+                        changes.append(change)
+
+                        if self.on_change:
+                            self.on_change(change)
+        finally:
+            # A failed login or callback leaves popped entries unobserved; without a new due time they would never
+            # be polled again. Entries re-added or removed meanwhile already have their own schedule.
+            with self._lock:
+                for entry in due:
+                    if entry.key in popped and self.state.get(entry.key, {}).get("next_at") == popped[entry.key]:
+                        self._reschedule(entry, time.time())
+
+            self.save_state()
+
+        return changes
+
+    def run(self, stop_event: Optional[threading.Event] = None):
+        """Poll the due entries as they come due until the stop event is set."""
+
+        stop_event = stop_event or threading.Event()
+
+        while not stop_event.is_set():
+            try:
+                self.poll_due()
+            except Exception:
+                logger.exception("Fare watch poll failed")
+
+            due_at = self.next_due()
+            stop_event.wait(max(0.0, due_at - time.time()) if due_at is not None else 1.0)
+
+    def _observe(self, entry: FlightWatchEntry, result: Any) -> Optional[FlightFareChange]:
+        """Record the outcome of a search, reschedule its entry and return the fare change, if any."""
+
+        observed_at = time.time()
+        change = None
+
+        with self._lock:
+            if entry.key not in self.entries:
+                return None
+
+            state = self._reschedule(entry, observed_at)
+
+            if isinstance(result, Exception) or result[0] != 200:
+                logger.warning("Fare watch %s failed: %r", entry.key,
+                               result if isinstance(result, Exception) else result[0])
+                return None
+
+            offers = (result[1] or {}).get("data", [])
+            cheapest = min(offers, key=offer_price, default=None)
+            price = offer_price(cheapest) if cheapest is not None else math.inf
+
+            # Offers without a parsable grandTotal price as infinity: record them as no fare, like no offers.
+            if math.isinf(price):
+                cheapest = price = None
+
+            currency = cheapest.get("price", {}).get("currency") if cheapest is not None else None
+            previous = state.get("price")
+
+            if "observed_at" not in state:
+                changed = False
+            elif price is None or previous is None:
+                changed = price != previous
+            else:
+                changed = price != previous and abs(price - previous) >= self.min_change
+
+            if changed:
+                change = FlightFareChange(key=entry.key, previous=previous, current=price, currency=currency,
+                                          observed_at=observed_at)
+
+            state.update(price=price, currency=currency, observed_at=observed_at)
+
+        return change
+
+    def _reschedule(self, entry: FlightWatchEntry, now: float) -> Dict[str, Any]:
+        """Schedule an entry one jittered interval after now and return its state. The lock must be held."""
+
+        due_at = now + entry.interval * (1 + random.uniform(-self.jitter, self.jitter))
+        state = self.state.setdefault(entry.key, {})
+        state["next_at"] = due_at
+        heapq.heappush(self._schedule, (due_at, entry.key))
+
+        return state
+
+    def _discard_stale(self):
+        """Drop schedule items of removed entries and superseded due times. The lock must be held."""
+
+        while self._schedule:
+            due_at, key = self._schedule[0]
+
+            if key in self.entries and self.state.get(key, {}).get("next_at") == due_at:
+                return
+
+            heapq.heappop(self._schedule)
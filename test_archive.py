@@ -0,0 +1,46 @@
+import json
+from datetime import datetime, timezone
+
+from sythonlab_amadeus_enterprise_rest.core.enums import Currency, RequestMethod
+from sythonlab_amadeus_enterprise_rest.flights.archive import FlightArchive
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import FlightRequestMetadata
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightResultKind
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=False, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD, compact_metadata=True)
+archive = FlightArchive("archive", segment_size=16 * 1024 * 1024, segment_age=3600)
+
+status, data = sdk.retrieve_by_booking_id(booking_id="eJzTd9f3NjIJdgYADJsCjA%3D%3D", on_complete=archive)
+archive.flush()
+
+for entry in archive.find(booking_id="eJzTd9f3NjIJdgYADJsCjA%3D%3D"):
+    print(entry)
+    print(archive.read(entry)["response"])
+
+# Card data and passenger PII of a reserve are redacted before they reach the archive.
+archive(metadata=FlightRequestMetadata(
+    status=201,
+    ama_client="CLT/2026-10-18T00:00:00.000Z/example/user1",
+    method=RequestMethod.POST,
+    url="https://test.api.amadeus.com/v1/booking/flight-orders",
+    kind=FlightResultKind.FLIGHT_RESERVE,
+    headers={"Authorization": "Bearer secret-token", "Content-Type": "application/json"},
+    request={"data": {
+        "travelers": [{"name": {"firstName": "JOHN", "lastName": "DOE"},
+                       "documents": [{"number": "P1234567", "issuanceCountry": "JM"}]}],
+        "formOfPayments": [{"creditCard": {"holder": "JOHN DOE", "number": "4111111111111111",
+                                           "expiryDate": "2030-01", "securityCode": "123"}}],
+    }},
+    response={"data": {"type": "flight-order", "id": "EXAMPLE-ORDER",
+                       "associatedRecords": [{"reference": "ABC123", "originSystemCode": "GDS"}]}},
+    start_time=datetime.now(timezone.utc),
+))
+archive.flush()
+
+record = archive.lookup(booking_id="EXAMPLE-ORDER")[0]
+print(json.dumps(record["request"], indent=2))
+
+for secret in ("secret-token", "4111111111111111", "\"123\"", "P1234567", "JOHN"):
+    assert secret not in json.dumps(record), secret
+
+archive.close()
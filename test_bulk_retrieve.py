@@ -0,0 +1,7 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import Currency
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+for locator, retrieve_status, retrieve_data in sdk.bulk_retrieve(locators=["BR3QEP", "BTFD67"], max_workers=4):
+    print(locator, retrieve_status)
@@ -0,0 +1,20 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=False, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+status, data = sdk.search_availability(itinerary=[
+    SearchAvailabilityItinerary(id="1", origin_location_code="KIN", destination_location_code="MIA",
+                                departure_date="2026-05-15"),
+], travelers=[SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT)])
+
+results = sdk.bulk_branded_fare_upsell(pricing_data=data["data"][:5])
+
+print("Upsell calls:", results.calls)
+
+for offer_id, options in results.options.items():
+    print(offer_id, [(option.brand, option.price, option.currency) for option in options])
+
+for offer_id, error in results.errors.items():
+    print("Failed", offer_id, error)
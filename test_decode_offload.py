@@ -0,0 +1,29 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax
+from sythonlab_amadeus_enterprise_rest.flights.offload import DecodeOffload
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+
+def cheapest_offers(data):
+    return sorted(data.get("data", []), key=lambda offer: float(offer["price"]["grandTotal"]))[:10]
+
+
+if __name__ == "__main__":
+    offload = DecodeOffload(max_workers=2)
+    sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD, offload=offload)
+
+    availability_status, cheapest = sdk.search_availability(itinerary=[
+        SearchAvailabilityItinerary(
+            id="1",
+            origin_location_code="KIN",
+            destination_location_code="MIA",
+            departure_date="2026-05-15"
+        ),
+    ], travelers=[
+        SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT),
+    ], projection=["data.id", "data.price", "data.itineraries", "data.validatingAirlineCodes"],
+        transform=cheapest_offers)
+
+    print(availability_status, [offer["price"]["grandTotal"] for offer in cheapest])
+
+    offload.shutdown()
@@ -0,0 +1,24 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityPax
+from sythonlab_amadeus_enterprise_rest.flights.matrix import FareMatrix
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=False, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+matrix = FareMatrix.around(
+    sdk,
+    origin="KIN",
+    destination="MIA",
+    departure_date="2026-05-15",
+    return_date="2026-05-22",
+    travelers=[SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT)],
+    ttl=900
+)
+
+print("Refreshed cells:", matrix.refresh())
+
+for row in matrix.table():
+    print(row)
+
+print("Cheapest:", matrix.cheapest())
+print("Refreshed cells:", matrix.refresh())
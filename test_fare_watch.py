@@ -0,0 +1,39 @@
+import threading
+
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax, \
+    FlightWatchEntry
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+from sythonlab_amadeus_enterprise_rest.flights.watch import FareWatcher
+
+sdk = FlightSDK(debug=False, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+entries = [
+    FlightWatchEntry(
+        key=f"KIN-{destination}",
+        itinerary=[
+            SearchAvailabilityItinerary(
+                id="1",
+                origin_location_code="KIN",
+                destination_location_code=destination,
+                departure_date="2026-05-15"
+            ),
+        ],
+        travelers=[SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT)],
+        interval=600
+    )
+    for destination in ("MIA", "JFK", "FLL", "MCO")
+]
+
+watcher = FareWatcher(
+    sdk,
+    entries=entries,
+    rate=0.5,
+    min_change=1.0,
+    state_path="fare_watch.json",
+    on_change=lambda change: print(f"{change.key}: {change.previous} -> {change.current} {change.currency}")
+)
+
+stop_event = threading.Event()
+threading.Timer(3600, stop_event.set).start()
+watcher.run(stop_event)
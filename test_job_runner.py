@@ -0,0 +1,15 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import Currency
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightJobOperation
+from sythonlab_amadeus_enterprise_rest.flights.jobs import FlightJobJournal, FlightJobRunner
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+runner = FlightJobRunner(sdk, FlightJobJournal("jobs.db"), max_workers=4, rate=5)
+
+progress = runner.run(
+    job_id="eod-2026-05-15",
+    operation=FlightJobOperation.ISSUE,
+    booking_ids=["eJzTd9d3DoiMCrIAAAuhAnY"],
+    on_progress=lambda progress: print(progress.processed, "/", progress.total),
+)
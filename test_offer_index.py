@@ -0,0 +1,24 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax
+from sythonlab_amadeus_enterprise_rest.flights.offers import OfferIndex
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+availability_status, availability_data = sdk.search_availability(itinerary=[
+    SearchAvailabilityItinerary(
+        id="1",
+        origin_location_code="KIN",
+        destination_location_code="MIA",
+        departure_date="2026-05-15"
+    ),
+], travelers=[
+    SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT),
+])
+
+index = OfferIndex.from_response(availability_data)
+
+for group in index:
+    print(group.fingerprint, group.cheapest["price"]["grandTotal"], len(group.variants))
+
+print(f"{len(index)} flight sets, {index.duplicates} duplicates")
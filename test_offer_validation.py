@@ -0,0 +1,29 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency, PaymentMethod
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax
+from sythonlab_amadeus_enterprise_rest.flights.exceptions import FlightOfferValidationError
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+from sythonlab_amadeus_enterprise_rest.flights.validation import OfferValidator
+
+validator = OfferValidator(min_departure_lead=3 * 3600, max_search_age=15 * 60)
+sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD, validator=validator)
+
+availability_status, availability_data = sdk.search_availability(itinerary=[
+    SearchAvailabilityItinerary(
+        id="1",
+        origin_location_code="KIN",
+        destination_location_code="MIA",
+        departure_date="2026-05-15"
+    ),
+], travelers=[
+    SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT),
+    SearchAvailabilityPax(id="2", traveler_type=TravelerType.ADULT),
+])
+
+for offer in availability_data.get("data", [])[:5]:
+    try:
+        pricing_status, pricing_data = sdk.pricing(flight_data=offer, payment_method=PaymentMethod.CASH)
+        print(offer["id"], pricing_status)
+    except FlightOfferValidationError as error:
+        print(offer["id"], error.reasons)
+
+print(validator.stats())
@@ -0,0 +1,18 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax
+from sythonlab_amadeus_enterprise_rest.flights.profiling import FlightProfiler
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+profiler = FlightProfiler(sample_rate=0.25)
+sdk = FlightSDK(debug=False, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD, profiler=profiler)
+
+for _ in range(20):
+    sdk.search_availability(itinerary=[
+        SearchAvailabilityItinerary(id="1", origin_location_code="KIN", destination_location_code="MIA",
+                                    departure_date="2026-05-15"),
+    ], travelers=[SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT)])
+
+print(profiler.report())
+
+with open("flight_sdk_cpu.folded", "w") as folded_file:
+    folded_file.write(profiler.folded("cpu"))
@@ -0,0 +1,16 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import Currency
+from sythonlab_amadeus_enterprise_rest.flights.queues import FlightQueueWatcher
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+watcher = FlightQueueWatcher(
+    sdk,
+    queue="30",
+    category="0",
+    snapshot_path="queue_30_0.json",
+    on_added=lambda key, entry, status, data: print("Added", key, status),
+    on_removed=lambda key: print("Removed", key),
+)
+
+print(watcher.poll())
@@ -0,0 +1,25 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import TravelerType, Currency
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax, \
+    SearchOptions
+from sythonlab_amadeus_enterprise_rest.flights.enums import FlightCabin
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD)
+
+availability_status, availability_data = sdk.search_availability(itinerary=[
+    SearchAvailabilityItinerary(
+        id="1",
+        origin_location_code="KIN",
+        destination_location_code="MIA",
+        departure_date="2026-05-15"
+    ),
+], travelers=[
+    SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT),
+], options=SearchOptions(
+    max_flight_offers=20,
+    branded_fares=False,
+    max_upsell_offers=0,
+    cabin=FlightCabin.ECONOMY,
+    max_stops=1,
+    excluded_carriers=["NK"]
+))
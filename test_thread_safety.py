@@ -0,0 +1,111 @@
+import logging
+import random
+import statistics
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sythonlab_amadeus_enterprise_rest.core.enums import Currency, TravelerType, RequestMethod
+from sythonlab_amadeus_enterprise_rest.flights.dataclasses import SearchAvailabilityItinerary, SearchAvailabilityPax
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+from sythonlab_amadeus_enterprise_rest.flights.transports import InMemoryTransport
+
+logging.getLogger().setLevel(logging.INFO)
+
+THREADS = 32
+CALLS = 6000
+LATENCY = 0.005
+TOKEN_LIFETIME = 1
+
+
+class FakeAmadeus:
+    """In-process fake of the Amadeus API that checks every request it receives."""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.tokens = {}
+        self.refs = set()
+        self.logins = 0
+        self.requests = 0
+        self.errors = []
+
+    def handle(self, method, url, payload, headers):
+        time.sleep(LATENCY * random.uniform(0.5, 1.5))
+
+        with self.lock:
+            self.requests += 1
+            ref = headers.get("ama-client-ref")
+
+            if not ref or ref in self.refs:
+                self.errors.append(f"missing or repeated ama-client-ref: {ref}")
+            self.refs.add(ref)
+
+            if "oauth2" in url:
+                self.logins += 1
+                token = f"token-{self.logins}"
+                self.tokens[token] = time.monotonic() + TOKEN_LIFETIME
+                return 200, {"access_token": token, "expires_in": TOKEN_LIFETIME}
+
+            token = headers.get("Authorization", "").removeprefix("Bearer ")
+
+            if self.tokens.get(token, 0) < time.monotonic():
+                self.errors.append(f"invalid or expired token on {url}: {token!r}")
+                return 401, {"errors": [{"status": 401}]}
+
+        return 200, {"data": [{"id": "1", "price": {"grandTotal": "100.00"}}]}
+
+
+fake = FakeAmadeus()
+sdk = FlightSDK(prefix_ama_ref="CLT", suffix_ama_ref="stress", currency=Currency.USD,
+                transport=InMemoryTransport(fake.handle))
+sdk.token_margin = 0.5
+shared_headers = {"Content-Type": "application/json"}
+
+
+def operation(index):
+    start = time.perf_counter()
+
+    if index % 3 == 0:
+        status, _ = sdk.retrieve_by_booking_id(booking_id=f"B{index}")
+    elif index % 3 == 1:
+        sdk.login()
+        status, _ = sdk.request(url=f"https://fake/v1/booking/flight-orders/{index}", headers=shared_headers,
+                                method=RequestMethod.GET)
+    else:
+        status, _ = sdk.search_availability(itinerary=[
+            SearchAvailabilityItinerary(id="1", origin_location_code="KIN", destination_location_code="MIA",
+                                        departure_date="2026-05-15"),
+        ], travelers=[SearchAvailabilityPax(id="1", traveler_type=TravelerType.ADULT)])
+
+    return status, time.perf_counter() - start
+
+
+def run(label, shared):
+    fake.logins = fake.requests = 0
+    started = time.perf_counter()
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        if shared:
+            with sdk.shared_token():
+                results = list(executor.map(operation, range(CALLS)))
+        else:
+            results = list(executor.map(operation, range(CALLS)))
+
+    elapsed = time.perf_counter() - started
+    latencies = sorted(latency for _, latency in results)
+    failed = [status for status, _ in results if status != 200]
+
+    print(f"[{label}] {CALLS} calls on {THREADS} threads in {elapsed:.2f}s ({CALLS / elapsed:.0f} calls/s)")
+    print(f"[{label}] logins: {fake.logins}, requests: {fake.requests}, failed calls: {len(failed)}")
+    print(f"[{label}] latency p50 {statistics.median(latencies) * 1000:.1f}ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f}ms (transport {LATENCY * 1000:.1f}ms)")
+
+    assert not fake.errors, fake.errors[:5]
+    assert not failed, failed[:5]
+
+
+run("per-call login", shared=False)
+run("shared token", shared=True)
+
+assert shared_headers == {"Content-Type": "application/json"}
+print("Shared headers untouched, every ama-client-ref unique, no expired or torn token sent")
@@ -0,0 +1,12 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import Currency
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+from sythonlab_amadeus_enterprise_rest.flights.transports import RequestsTransport, Urllib3Transport, HttpxTransport
+
+for transport in (RequestsTransport(pool_size=4), Urllib3Transport(pool_size=4), HttpxTransport(http2=True)):
+    sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD,
+                    transport=transport)
+
+    retrieve_status, retrieve_data = sdk.retrieve_by_locator(locator="8ZV6T7")
+    print(type(transport).__name__, retrieve_status)
+
+    transport.close()
@@ -0,0 +1,13 @@
+from sythonlab_amadeus_enterprise_rest.core.enums import Currency
+from sythonlab_amadeus_enterprise_rest.flights.sdk import FlightSDK
+
+sdk = FlightSDK(debug=True, prefix_ama_ref="CLT", suffix_ama_ref="user1", currency=Currency.JMD, pool_size=8,
+                reuse_token=True)
+
+warm_up = sdk.warm_up(connections=8, keep_alive=30)
+print(warm_up)
+
+retrieve_status, retrieve_data = sdk.retrieve_by_locator(locator="8ZV6T7")
+print(retrieve_status)
+
+sdk.stop_keep_alive()